@@ -5,20 +5,36 @@ YouTube Shorts Uploader - メインスクリプト
 YouTube Shorts動画を自動アップロードするコマンドラインツール
 """
 
+import os
 import sys
+import signal
 import argparse
-from src import (
-    authenticate_youtube,
-    get_channel_info,
-    upload_shorts_video,
-    ShortsBatchUploader,
-    ShortsValidator,
-    QuotaManager
-)
+
+# src配下のモジュールは各コマンド内でインポートする
+# （quota などGoogle APIクライアントを使わないコマンドの起動を速くするため）
+
+# アップロード成功のたびに履歴を追記するファイル
+AUTOSAVE_HISTORY_FILE = os.path.join('logs', 'autosave_history.csv')
+
+
+def exit_on_sigterm():
+    """
+    SIGTERMを受け取ったらSystemExitを送出する
+
+    タスクスケジューラーなどから終了させられた場合も、
+    呼び出し元の finally ブロック（履歴の保存など）が実行されるようにする
+    """
+    def handler(signum, frame):
+        print("\n終了要求を受け取りました")
+        sys.exit(1)
+
+    signal.signal(signal.SIGTERM, handler)
 
 
 def cmd_auth(args):
     """認証コマンド"""
+    from src import authenticate_youtube, get_channel_info
+
     print("=== YouTube API 認証 ===\n")
 
     youtube = authenticate_youtube()
@@ -40,6 +56,8 @@ def cmd_auth(args):
 
 def cmd_upload(args):
     """単一動画アップロードコマンド"""
+    from src import authenticate_youtube, ShortsValidator, QuotaManager
+
     print("=== YouTube Shorts アップロード ===\n")
 
     # 認証
@@ -70,6 +88,7 @@ def cmd_upload(args):
 
     # 再生リスト処理
     playlist_id = None
+    playlist_manager = None
     if args.playlist:
         from src.playlist_manager import PlaylistManager
         playlist_manager = PlaylistManager(youtube)
@@ -102,7 +121,12 @@ def cmd_upload(args):
     # アップロード実行
     print("\nアップロードを開始します...")
     from src.uploader import upload_with_retry
-    result = upload_with_retry(youtube, args.video_file, metadata)
+    result = upload_with_retry(
+        youtube,
+        args.video_file,
+        metadata,
+        playlist_manager=playlist_manager
+    )
 
     if result:
         print("\n=== アップロード成功 ===")
@@ -119,29 +143,42 @@ def cmd_upload(args):
 
 def cmd_batch_upload(args):
     """バッチアップロードコマンド"""
+    from src import authenticate_youtube, load_credentials, ShortsBatchUploader, QuotaManager
+
     print("=== YouTube Shorts バッチアップロード ===\n")
 
-    # 認証
-    youtube = authenticate_youtube()
+    # 認証（同時アップロードのワーカーも同じ認証情報を使う）
+    credentials = load_credentials()
+    youtube = authenticate_youtube(credentials=credentials)
 
     # クォータチェック
     quota_manager = QuotaManager()
     quota_manager.print_status()
 
     # バッチアップローダーの初期化
-    uploader = ShortsBatchUploader(youtube)
+    uploader = ShortsBatchUploader(
+        youtube,
+        max_workers=args.workers,
+        history_file=AUTOSAVE_HISTORY_FILE,
+        credentials=credentials
+    )
 
     # アップロード実行
-    if args.csv_file:
-        # CSVから
-        results = uploader.upload_from_csv(args.csv_file)
-    else:
-        # ディレクトリから
-        results = uploader.upload_from_directory(
-            args.directory,
-            pattern=args.pattern,
-            interval_minutes=args.interval
-        )
+    exit_on_sigterm()
+    try:
+        if args.csv_file:
+            # CSVから
+            results = uploader.upload_from_csv(args.csv_file)
+        else:
+            # ディレクトリから
+            results = uploader.upload_from_directory(
+                args.directory,
+                pattern=args.pattern,
+                interval_minutes=args.interval
+            )
+    finally:
+        # 履歴はアップロードのたびに追記済み。中断された場合もファイルを確実に閉じる
+        uploader.close_history()
 
     # 履歴を保存
     if results and args.save_history:
@@ -157,6 +194,8 @@ def cmd_batch_upload(args):
 
 def cmd_validate(args):
     """動画検証コマンド"""
+    from src import ShortsValidator
+
     print("=== YouTube Shorts 動画検証 ===\n")
 
     if args.directory:
@@ -170,6 +209,8 @@ def cmd_validate(args):
 
 def cmd_quota(args):
     """クォータ管理コマンド"""
+    from src import QuotaManager
+
     print("=== YouTube API クォータ管理 ===\n")
 
     quota_manager = QuotaManager()
@@ -184,20 +225,31 @@ def cmd_quota(args):
 
 def cmd_scheduled_upload(args):
     """スケジュール実行用バッチアップロードコマンド"""
-    import sys
+    from src import authenticate_youtube, load_credentials, ShortsBatchUploader
 
-    # 認証
-    youtube = authenticate_youtube()
+    # 認証（同時アップロードのワーカーも同じ認証情報を使う）
+    credentials = load_credentials()
+    youtube = authenticate_youtube(credentials=credentials)
 
     # バッチアップローダーの初期化
-    uploader = ShortsBatchUploader(youtube)
+    uploader = ShortsBatchUploader(
+        youtube,
+        max_workers=args.workers,
+        history_file=AUTOSAVE_HISTORY_FILE,
+        credentials=credentials
+    )
 
     # スケジュール実行
-    result = uploader.upload_from_csv_scheduled(
-        args.csv_file,
-        max_uploads=args.max_uploads,
-        log_file=args.log_file
-    )
+    exit_on_sigterm()
+    try:
+        result = uploader.upload_from_csv_scheduled(
+            args.csv_file,
+            max_uploads=args.max_uploads,
+            log_file=args.log_file
+        )
+    finally:
+        # 履歴はアップロードのたびに追記済み。中断された場合もファイルを確実に閉じる
+        uploader.close_history()
 
     # 終了コードを設定（失敗時は1を返す）
     if not result['success'] or result['failed'] > 0:
@@ -242,6 +294,8 @@ def main():
     batch_parser.add_argument('--pattern', default='*.mp4', help='ファイルパターン（デフォルト: *.mp4）')
     batch_parser.add_argument('-i', '--interval', type=int, default=30,
                             help='アップロード間隔（分、デフォルト: 30）')
+    batch_parser.add_argument('-w', '--workers', type=int, default=1,
+                            help='同時にアップロードする動画数（デフォルト: 1）')
     batch_parser.add_argument('--save-history', action='store_true', help='アップロード履歴を保存')
     batch_parser.set_defaults(func=cmd_batch_upload)
 
@@ -264,6 +318,8 @@ def main():
                                  help='メタデータCSVファイル（デフォルト: upload_list.csv）')
     scheduled_parser.add_argument('-n', '--max-uploads', type=int, default=5,
                                  help='1回の実行で処理する最大件数（デフォルト: 5）')
+    scheduled_parser.add_argument('-w', '--workers', type=int, default=1,
+                                 help='同時にアップロードする動画数（デフォルト: 1）')
     scheduled_parser.add_argument('--log-file', help='ログファイルのパス（指定しない場合は自動生成）')
     scheduled_parser.set_defaults(func=cmd_scheduled_upload)
 
@@ -4,17 +4,14 @@ YouTube Shorts Uploader
 YouTube Data API v3を使用してShorts動画を自動アップロードするツール
 """
 
+import importlib
+
 __version__ = '1.0.0'
 __author__ = 'YouTube Shorts Uploader'
 
-from .auth import authenticate_youtube, get_channel_info
-from .uploader import upload_shorts_video, upload_with_retry
-from .batch_uploader import ShortsBatchUploader
-from .validator import ShortsValidator
-from .quota_manager import QuotaManager, QuotaExceededError
-
 __all__ = [
     'authenticate_youtube',
+    'load_credentials',
     'get_channel_info',
     'upload_shorts_video',
     'upload_with_retry',
@@ -23,3 +20,33 @@ __all__ = [
     'QuotaManager',
     'QuotaExceededError',
 ]
+
+# 公開名 -> 定義しているモジュール
+# Google APIクライアントの読み込みは重いため、実際に使われるまでインポートしない
+_LAZY_IMPORTS = {
+    'authenticate_youtube': '.auth',
+    'load_credentials': '.auth',
+    'get_channel_info': '.auth',
+    'upload_shorts_video': '.uploader',
+    'upload_with_retry': '.uploader',
+    'ShortsBatchUploader': '.batch_uploader',
+    'ShortsValidator': '.validator',
+    'QuotaManager': '.quota_manager',
+    'QuotaExceededError': '.quota_manager',
+}
+
+
+def __getattr__(name):
+    """公開名が初めて参照されたときに定義元モジュールをインポートする"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """遅延インポートの名前もdir()に含める"""
+    return sorted(set(globals()) | set(__all__))
@@ -4,7 +4,7 @@ OAuth 2.0認証を使用してYouTube Data API v3にアクセスします。
 """
 
 import os
-import glob
+import re
 from googleapiclient.discovery import build
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
@@ -16,6 +16,11 @@ SCOPES = [
     'https://www.googleapis.com/auth/youtube'
 ]
 
+# Google Cloud Consoleからダウンロードした認証情報ファイル名のパターン
+# os.path.normcase() したファイル名と比較する（Windowsでは glob と同様に大文字小文字を区別しない）
+_CLIENT_SECRET_NAME = os.path.normcase('client_secret.json')
+_CLIENT_SECRET_PATTERN = re.compile(r'client_secret.*\.json')
+
 
 def find_client_secret_file():
     """
@@ -27,17 +32,22 @@ def find_client_secret_file():
     Raises:
         FileNotFoundError: client_secretファイルが見つからない場合
     """
-    # カレントディレクトリで検索
-    patterns = [
-        'client_secret.json',
-        'client_secret*.json',
-        '../client_secret*.json'
-    ]
-
-    for pattern in patterns:
-        files = glob.glob(pattern)
-        if files:
-            return files[0]
+    # カレントディレクトリを優先し、次に親ディレクトリを検索
+    # 各ディレクトリの一覧は1回だけ取得する
+    for directory in ('.', '..'):
+        try:
+            entries = os.listdir(directory)
+        except OSError:
+            continue
+
+        names = {os.path.normcase(name): name for name in entries}
+
+        if directory == '.' and _CLIENT_SECRET_NAME in names:
+            return names[_CLIENT_SECRET_NAME]
+
+        for name in sorted(entries):
+            if _CLIENT_SECRET_PATTERN.fullmatch(os.path.normcase(name)):
+                return name if directory == '.' else os.path.join(directory, name)
 
     raise FileNotFoundError(
         "client_secret.jsonファイルが見つかりません。\n"
@@ -46,16 +56,16 @@ def find_client_secret_file():
     )
 
 
-def authenticate_youtube(token_file='token.json', client_secret_file=None):
+def load_credentials(token_file='token.json', client_secret_file=None):
     """
-    YouTube APIの認証を行う
+    認証情報を取得する（保存済みトークンの読み込み・更新、または新規認証）
 
     Args:
         token_file (str): 認証トークンを保存するファイルのパス
         client_secret_file (str): クライアントシークレットファイルのパス
 
     Returns:
-        googleapiclient.discovery.Resource: YouTube API クライアント
+        google.oauth2.credentials.Credentials: 認証情報
     """
     creds = None
 
@@ -101,8 +111,26 @@ def authenticate_youtube(token_file='token.json', client_secret_file=None):
         except Exception as e:
             print(f"警告: トークンの保存に失敗しました: {e}")
 
+    return creds
+
+
+def authenticate_youtube(token_file='token.json', client_secret_file=None, credentials=None):
+    """
+    YouTube APIの認証を行う
+
+    Args:
+        token_file (str): 認証トークンを保存するファイルのパス
+        client_secret_file (str): クライアントシークレットファイルのパス
+        credentials: 取得済みの認証情報（Noneの場合は load_credentials で取得）
+
+    Returns:
+        googleapiclient.discovery.Resource: YouTube API クライアント
+    """
+    if credentials is None:
+        credentials = load_credentials(token_file, client_secret_file)
+
     # YouTube APIクライアントを構築
-    youtube = build('youtube', 'v3', credentials=creds)
+    youtube = build('youtube', 'v3', credentials=credentials)
     print("YouTube APIクライアントの初期化が完了しました")
 
     return youtube
@@ -5,28 +5,289 @@ YouTube Shorts バッチアップロードモジュール
 
 import os
 import time
+import random
 import csv
-import glob
 import shutil
 import logging
+import itertools
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from .uploader import upload_with_retry
-from .playlist_manager import PlaylistManager
+from .playlist_manager import PlaylistManager, PLAYLIST_BATCH_SIZE
+from .validator import ShortsValidator
+
+# CSVで省略された列の既定値
+CSV_DEFAULTS = {
+    'title': '',
+    'description': '',
+    'tags': '',
+    'category_id': '22',
+    'privacy_status': 'public',
+    'publish_at': None
+}
+
+# 動画ファイルの存在確認を並行して行うスレッド数の上限
+EXISTS_CHECK_WORKERS = 16
+
+# アップロード履歴CSVの列
+HISTORY_FIELDS = ['file', 'video_id', 'title', 'url', 'uploaded_at', 'scheduled_for', 'privacy_status']
+
+# アップロードが連続して失敗した場合の待機時間の範囲（秒）
+UPLOAD_BACKOFF_MIN = 1
+UPLOAD_BACKOFF_MAX = 30
+
+
+def _upload_backoff(consecutive_failures):
+    """
+    次のアップロードまでの待機時間を計算
+
+    成功が続いている間は待機しない。失敗が続く場合は1秒から倍々に増やし
+    （上限30秒）、複数の実行が同時に再試行しないようジッターを加える
+
+    Args:
+        consecutive_failures (int): 直前までに連続して失敗した回数
+
+    Returns:
+        float: 待機時間（秒）
+    """
+    if consecutive_failures <= 0:
+        return 0
+
+    base = min(UPLOAD_BACKOFF_MAX, UPLOAD_BACKOFF_MIN * 2 ** (consecutive_failures - 1))
+    return base + random.uniform(0, 1)
+
+
+def _split_tags(value):
+    """
+    CSVのtags列（カンマ区切り）をタグのリストに変換
+
+    値そのものをCSVとして解析するため、"a,\"b,c\"" のように
+    引用符で囲んだタグはカンマを含められる。
+    セル内の改行（引用符で囲んだセルでは有効）はカンマと同じく区切りとして扱う
+
+    Args:
+        value (str): tags列の値
+
+    Returns:
+        list: タグのリスト（空のタグは除く）
+    """
+    if not value:
+        return []
+
+    # 行ごとに渡す（改行を含む文字列を1要素で渡すと csv.Error になる）
+    fields = itertools.chain.from_iterable(csv.reader(value.splitlines(), skipinitialspace=True))
+    return [tag.strip() for tag in fields if tag.strip()]
 
 
 class ShortsBatchUploader:
     """YouTube Shorts バッチアップロードクラス"""
 
-    def __init__(self, youtube_client):
+    def __init__(self, youtube_client, max_workers=1, history_file=None, credentials=None):
         """
         初期化
 
         Args:
             youtube_client: YouTube API クライアント
+            max_workers (int): 同時にアップロードする動画数（デフォルト: 1 = 順番に処理）
+            history_file (str): アップロード成功のたびに履歴を追記するCSV（Noneの場合は追記しない）
+            credentials: youtube_client の認証情報（max_workers が2以上の場合に必要）
         """
         self.youtube = youtube_client
         self.upload_history = []
         self.playlist_manager = PlaylistManager(youtube_client)
+        self.credentials = credentials
+        self.max_workers = max(1, max_workers)
+        if self.max_workers > 1 and credentials is None:
+            print("警告: 認証情報が指定されていないため、動画を1本ずつアップロードします")
+            self.max_workers = 1
+        self._thread_local = threading.local()
+        self._pending_playlist_ops = []  # (再生リストID, 動画ID) のリスト
+        self.playlist_ops_added = 0  # 再生リストへの追加に成功した累計件数
+        self.playlist_ops_failed = 0  # 再生リストへの追加に失敗した累計件数
+        self.history_file = history_file
+        self._history_fp = None
+        self._history_writer = None
+
+    def _resolve_playlist(self, playlist_name):
+        """
+        再生リスト名からIDを取得
+
+        PlaylistManager の索引（一定時間ごとに取得し直す）から引くため、同じ名前の行が
+        続いてもAPIの呼び出しは索引の取得1回だけで、見つからなかった名前も後から作成されれば見つかる
+
+        Args:
+            playlist_name (str): 再生リスト名
+
+        Returns:
+            str: 再生リストID、見つからない場合はNone
+        """
+        return self.playlist_manager.get_playlist(playlist_name)
+
+    def clear_playlist_cache(self):
+        """
+        再生リストの索引を破棄し、次回の検索で取得し直す（長時間動作させる場合に使用）
+        """
+        self.playlist_manager.clear_cache()
+
+    def _get_thread_http(self):
+        """
+        ワーカースレッド専用のHTTPオブジェクトを取得
+
+        googleapiclientのHTTPオブジェクトはスレッドセーフではないため、
+        認証情報だけを共有し、スレッドごとに別のHTTPオブジェクトを使う。
+        build_http() はクライアント既定と同じ設定（タイムアウト、再開可能アップロードの
+        308 をリダイレクトとして扱わない）のHTTPオブジェクトを作る
+
+        Returns:
+            google_auth_httplib2.AuthorizedHttp: 認証済みHTTPオブジェクト
+        """
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            from googleapiclient.http import build_http
+            from google_auth_httplib2 import AuthorizedHttp
+
+            http = AuthorizedHttp(self.credentials, http=build_http())
+            self._thread_local.http = http
+        return http
+
+    def _upload_in_worker(self, video_file, metadata):
+        """
+        ワーカースレッドで1本アップロード
+
+        Args:
+            video_file (str): 動画ファイルのパス
+            metadata (dict): 動画のメタデータ
+
+        Returns:
+            dict: アップロード結果、失敗した場合はNone
+        """
+        return upload_with_retry(self.youtube, video_file, metadata, http=self._get_thread_http())
+
+    def _iter_uploads(self, jobs, on_start=None, on_late_result=None):
+        """
+        (動画ファイル, メタデータ) のリストをアップロードし、結果を投入順に返す
+
+        max_workers が1の場合は呼び出し元がループを進めるたびに1本ずつアップロードする。
+        2以上の場合はスレッドプールで同時に最大 max_workers 本までアップロードし、
+        完了した順ではなく投入順に返す。
+        再生リストへの追加はアップロード時には行わず、50件たまるごとに
+        flush_playlist_ops() でまとめて行う（残りは呼び出し元が最後に実行する）。
+
+        中断された場合（例外・close()）は、まだ始まっていないアップロードを取り消し、
+        実行中のアップロードの完了を待つ。その結果は返せないため on_late_result に渡す。
+
+        Args:
+            jobs (list): (動画ファイル, メタデータ) のタプルのリスト
+            on_start (callable): 各動画の処理開始時に (番号, 動画ファイル) で呼ばれる関数
+            on_late_result (callable): 中断後に完了したアップロードごとに
+                (番号, 動画ファイル, メタデータ, 結果) で呼ばれる関数
+
+        Yields:
+            dict: アップロード結果、失敗した場合はNone
+        """
+        # 再生リストIDを外したメタデータでアップロードする
+        upload_jobs = [
+            (video_file, dict(metadata, playlist_id=None))
+            for video_file, metadata in jobs
+        ]
+
+        if self.max_workers == 1:
+            results = (
+                upload_with_retry(self.youtube, video_file, metadata)
+                for video_file, metadata in upload_jobs
+            )
+        else:
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            pending = deque()  # 投入済みで結果をまだ返していない (jobsの添字, Future)
+
+            def submit(index):
+                video_file, metadata = upload_jobs[index]
+                pending.append((index, executor.submit(self._upload_in_worker, video_file, metadata)))
+
+            # 一度に投入するのは max_workers 本まで（中断時に取り消す待ち行列を作らない）
+            for index in range(min(self.max_workers, len(upload_jobs))):
+                submit(index)
+
+            def iter_results():
+                while pending:
+                    result = self._future_result(pending[0][1])
+                    index, _ = pending.popleft()
+                    if index + self.max_workers < len(upload_jobs):
+                        submit(index + self.max_workers)
+                    yield result
+
+            results = iter_results()
+
+        try:
+            for i, (video_file, metadata) in enumerate(jobs, 1):
+                if on_start:
+                    on_start(i, video_file)
+
+                result = next(results)
+                self._queue_playlist_op(metadata, result)
+                yield result
+        finally:
+            if self.max_workers > 1:
+                # 開始前のアップロードは取り消し、実行中のものは完了を待つ
+                running = [(index, future) for index, future in pending if not future.cancel()]
+                if running:
+                    print(f"\n実行中のアップロード{len(running)}件の完了を待っています...")
+                executor.shutdown(wait=True)
+
+                for index, future in running:
+                    video_file, metadata = jobs[index]
+                    result = self._future_result(future)
+                    self._queue_playlist_op(metadata, result)
+                    if on_late_result:
+                        on_late_result(index + 1, video_file, metadata, result)
+
+    def _queue_playlist_op(self, metadata, result):
+        """
+        アップロードに成功した動画の再生リストへの追加を保留に積む（50件たまったら実行）
+
+        Args:
+            metadata (dict): 動画のメタデータ
+            result (dict): アップロード結果、失敗した場合はNone
+        """
+        playlist_id = metadata.get('playlist_id')
+        if result and playlist_id:
+            self._pending_playlist_ops.append((playlist_id, result['id']))
+            if len(self._pending_playlist_ops) >= PLAYLIST_BATCH_SIZE:
+                self.flush_playlist_ops()
+
+    @staticmethod
+    def _future_result(future):
+        """
+        ワーカースレッドの結果を取得（例外は失敗として扱う）
+
+        Args:
+            future (concurrent.futures.Future): アップロードのFuture
+
+        Returns:
+            dict: アップロード結果、失敗した場合はNone
+        """
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"\n予期しないエラーが発生しました: {e}")
+            return None
+
+    def flush_playlist_ops(self):
+        """
+        保留中の再生リストへの追加をバッチリクエストでまとめて実行
+
+        Returns:
+            tuple: (追加に成功した件数, 失敗した件数)
+        """
+        items = self._pending_playlist_ops
+        self._pending_playlist_ops = []
+
+        added, failed = self.playlist_manager.batch_add_videos(items)
+        self.playlist_ops_added += added
+        self.playlist_ops_failed += failed
+        return added, failed
 
     def schedule_upload(self, video_files, interval_minutes=30, metadata_list=None):
         """
@@ -40,28 +301,36 @@ class ShortsBatchUploader:
         Returns:
             list: アップロード結果のリスト
         """
-        scheduled_time = datetime.now()
+        # 予約投稿時刻の起点と自動生成する説明文の投稿日時は同じ時刻を使う
+        started_at = datetime.now()
+        scheduled_time = started_at
         results = []
 
         print(f"\n=== バッチアップロード開始 ===")
         print(f"対象動画数: {len(video_files)}")
-        print(f"投稿間隔: {interval_minutes}分\n")
+        print(f"投稿間隔: {interval_minutes}分")
+        if self.max_workers > 1:
+            print(f"同時アップロード数: {self.max_workers}")
+        print()
 
+        # メタデータを取得または自動生成し、予約投稿時刻を設定
+        jobs = []
         for i, video_file in enumerate(video_files):
-            print(f"\n[{i + 1}/{len(video_files)}] {os.path.basename(video_file)}")
-
-            # メタデータを取得または自動生成
             if metadata_list and i < len(metadata_list):
                 metadata = metadata_list[i]
             else:
-                metadata = self.generate_metadata(video_file)
+                metadata = self.generate_metadata(video_file, now=started_at)
 
-            # 予約投稿時刻を設定
             metadata['scheduled_time'] = scheduled_time
+            jobs.append((video_file, metadata))
+
+            # 次の投稿時刻を計算
+            scheduled_time += timedelta(minutes=interval_minutes)
 
-            # アップロード実行
-            result = upload_with_retry(self.youtube, video_file, metadata)
+        def print_header(number, video_file):
+            print(f"\n[{number}/{len(video_files)}] {os.path.basename(video_file)}")
 
+        def handle_result(number, video_file, metadata, result):
             if result:
                 # 履歴に追加
                 history_entry = {
@@ -70,24 +339,36 @@ class ShortsBatchUploader:
                     'title': result['title'],
                     'url': result['url'],
                     'uploaded_at': datetime.now().isoformat(),
-                    'scheduled_for': scheduled_time.isoformat(),
+                    'scheduled_for': metadata['scheduled_time'].isoformat(),
                     'privacy_status': result['privacy_status']
                 }
-                self.upload_history.append(history_entry)
+                self._record_history(history_entry)
                 results.append(result)
 
                 print(f"✓ アップロード成功: {result['url']}")
             else:
                 print(f"✗ アップロード失敗: {video_file}")
 
-            # 次の投稿時刻を計算
-            scheduled_time += timedelta(minutes=interval_minutes)
-
-            # API制限を考慮して待機（最後のファイル以外）
-            if i < len(video_files) - 1:
-                wait_time = 10
-                print(f"\n{wait_time}秒待機してから次の動画をアップロードします...")
-                time.sleep(wait_time)
+        # 中断後に完了したアップロードも履歴に残す
+        uploads = self._iter_uploads(jobs, on_start=print_header, on_late_result=handle_result)
+        try:
+            consecutive_failures = 0
+            for i, ((video_file, metadata), result) in enumerate(zip(jobs, uploads)):
+                handle_result(i + 1, video_file, metadata, result)
+                consecutive_failures = 0 if result else consecutive_failures + 1
+
+                # 失敗が続いている場合は待機（順番に処理する場合のみ、最後のファイル以外）
+                wait_time = _upload_backoff(consecutive_failures)
+                if self.max_workers == 1 and wait_time and i < len(video_files) - 1:
+                    print(f"\n{wait_time:.1f}秒待機してから次の動画をアップロードします...")
+                    time.sleep(wait_time)
+        finally:
+            # 実行中のアップロードの完了を待ってから、再生リストへの追加をまとめて実行
+            # （中断された場合も、アップロード済みの分は追加する）
+            uploads.close()
+            if self._pending_playlist_ops:
+                print("\n再生リストに追加しています...")
+                self.flush_playlist_ops()
 
         print(f"\n=== バッチアップロード完了 ===")
         print(f"成功: {len(results)}/{len(video_files)}")
@@ -106,12 +387,11 @@ class ShortsBatchUploader:
         Returns:
             list: アップロード結果のリスト
         """
-        # ディレクトリ内の動画ファイルを検索
-        search_pattern = os.path.join(directory, pattern)
-        video_files = sorted(glob.glob(search_pattern))
+        # ディレクトリ内の動画ファイルを検索（validate コマンドと同じ方法）
+        video_files = ShortsValidator.find_video_files(directory, pattern)
 
         if not video_files:
-            print(f"警告: {search_pattern} に一致するファイルが見つかりませんでした")
+            print(f"警告: {os.path.join(directory, pattern)} に一致するファイルが見つかりませんでした")
             return []
 
         print(f"{len(video_files)}個の動画ファイルが見つかりました")
@@ -144,30 +424,16 @@ class ShortsBatchUploader:
                 for row in reader:
                     video_files.append(row['file'])
 
-                    # タグをリストに変換
-                    tags = []
-                    if 'tags' in row and row['tags']:
-                        tags = [tag.strip() for tag in row['tags'].split(',')]
-
                     # 再生リスト名からIDを取得（見つからない場合は警告のみ）
                     playlist_id = None
                     if 'playlist_name' in row and row['playlist_name']:
-                        playlist_id = self.playlist_manager.get_playlist(row['playlist_name'])
+                        playlist_id = self._resolve_playlist(row['playlist_name'])
                         if not playlist_id:
                             print(f"警告: 再生リスト '{row['playlist_name']}' が見つかりません。")
                             print(f"      動画は再生リストなしでアップロードされます。")
                             print(f"      YouTube Studioで後から追加してください。")
 
-                    metadata = {
-                        'title': row.get('title', ''),
-                        'description': row.get('description', ''),
-                        'tags': tags,
-                        'category_id': row.get('category_id', '22'),
-                        'privacy_status': row.get('privacy_status', 'public'),
-                        'playlist_id': playlist_id,
-                        'publish_at': row.get('publish_at', None)  # ISO 8601形式: "2025-11-20T10:00:00Z"
-                    }
-                    metadata_list.append(metadata)
+                    metadata_list.append(self.row_to_metadata(row, playlist_id))
 
             print(f"{len(video_files)}件のメタデータを読み込みました")
             return self.schedule_upload(video_files, metadata_list=metadata_list)
@@ -179,27 +445,103 @@ class ShortsBatchUploader:
             print(f"エラー: CSVファイルの読み込みに失敗しました: {e}")
             return []
 
-    def generate_metadata(self, video_file):
+    def generate_metadata(self, video_file, now=None):
         """
         動画ファイル名からメタデータを自動生成
 
         Args:
             video_file (str): 動画ファイルのパス
+            now (datetime): 説明文に記載する投稿日時（Noneの場合は現在時刻）
 
         Returns:
             dict: メタデータ
         """
         filename = os.path.basename(video_file)
         base_name = os.path.splitext(filename)[0]
+        now = now or datetime.now()
 
         return {
             'title': f"{base_name}",
-            'description': f"自動アップロードされたShorts動画です。\n投稿日時: {datetime.now().strftime('%Y年%m月%d日 %H:%M')}",
+            'description': f"自動アップロードされたShorts動画です。\n投稿日時: {now.strftime('%Y年%m月%d日 %H:%M')}",
             'tags': ['Shorts', '自動投稿'],
             'category_id': '22',
             'privacy_status': 'public'
         }
 
+    @staticmethod
+    def row_to_metadata(row, playlist_id=None):
+        """
+        CSVの1行をアップロード用のメタデータに変換
+
+        Args:
+            row (dict): csv.DictReaderが返す1行
+            playlist_id (str): 解決済みの再生リストID
+
+        Returns:
+            dict: メタデータ
+        """
+        # 存在しない列を既定値で補う
+        row = {**CSV_DEFAULTS, **row}
+
+        return {
+            'title': row['title'],
+            'description': row['description'],
+            'tags': _split_tags(row['tags']),
+            'category_id': row['category_id'],
+            'privacy_status': row['privacy_status'],
+            'playlist_id': playlist_id,
+            'publish_at': row['publish_at']  # 日本時間: "2025-11-20 19:00"
+        }
+
+    def _record_history(self, entry):
+        """
+        アップロード履歴に1件追加（history_file が指定されていればファイルにも追記）
+
+        Args:
+            entry (dict): 履歴のエントリ
+        """
+        self.upload_history.append(entry)
+
+        if self.history_file:
+            try:
+                self.append_history(entry)
+            except Exception as e:
+                print(f"警告: 履歴の追記に失敗しました: {e}")
+
+    def append_history(self, entry):
+        """
+        history_file に履歴を1件追記
+
+        ファイルは初回だけ追記モードで開き、以降は同じwriterを使い回す。
+        1件ごとにフラッシュするため、途中で異常終了しても書き込んだ分は残る。
+
+        Args:
+            entry (dict): 履歴のエントリ
+        """
+        if self._history_writer is None:
+            directory = os.path.dirname(self.history_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            self._history_fp = open(self.history_file, 'a', newline='', encoding='utf-8')
+            self._history_writer = csv.DictWriter(self._history_fp, fieldnames=HISTORY_FIELDS)
+
+            # 新規ファイルの場合のみヘッダーを書き込む
+            if self._history_fp.tell() == 0:
+                self._history_writer.writeheader()
+
+        self._history_writer.writerow(entry)
+        self._history_fp.flush()
+
+    def close_history(self):
+        """
+        append_history で開いたファイルを閉じる
+        """
+        if self._history_fp is not None:
+            self._history_fp.close()
+            self._history_fp = None
+            self._history_writer = None
+
     def save_history(self, filename='upload_history.csv'):
         """
         アップロード履歴をCSVに保存
@@ -217,8 +559,7 @@ class ShortsBatchUploader:
                 filename = os.path.join('logs', filename)
 
             with open(filename, 'w', newline='', encoding='utf-8') as f:
-                fieldnames = self.upload_history[0].keys()
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer = csv.DictWriter(f, fieldnames=HISTORY_FIELDS)
                 writer.writeheader()
                 writer.writerows(self.upload_history)
 
@@ -237,19 +578,80 @@ class ShortsBatchUploader:
             return None
 
         total = len(self.upload_history)
-        privacy_counts = {}
-
-        for entry in self.upload_history:
-            privacy = entry['privacy_status']
-            privacy_counts[privacy] = privacy_counts.get(privacy, 0) + 1
+        privacy_counts = Counter(entry['privacy_status'] for entry in self.upload_history)
 
         return {
             'total_uploads': total,
-            'privacy_status_breakdown': privacy_counts,
+            'privacy_status_breakdown': dict(privacy_counts),
             'first_upload': self.upload_history[0]['uploaded_at'],
             'last_upload': self.upload_history[-1]['uploaded_at']
         }
 
+    @staticmethod
+    def _remove_file(path):
+        """
+        ファイルがあれば削除（一時ファイルの後始末用、失敗しても無視する）
+
+        Args:
+            path (str): ファイルのパス
+        """
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _update_scheduled_csv(self, csv_file, tmp_file, fieldnames, kept_rows, processed_count, logger):
+        """
+        スケジュール実行のCSVを、残りの行を書き出した一時ファイルに置き換える
+
+        Args:
+            csv_file (str): CSVファイルのパス
+            tmp_file (str): 今回処理しなかった行を書き出した一時ファイル
+            fieldnames (list): CSVのヘッダー
+            kept_rows (list): 今回読み込んだが処理しなかった行（一時ファイルの行より前に戻す）
+            processed_count (int): 削除する処理済みの行数
+            logger (logging.Logger): 出力先のロガー
+        """
+        merged_file = tmp_file + '.merge'
+        try:
+            if kept_rows:
+                # 未処理の行を先頭に戻した一時ファイルを作り直す
+                with open(tmp_file, 'r', newline='', encoding='utf-8') as src, \
+                        open(merged_file, 'w', newline='', encoding='utf-8') as dst:
+                    rest = csv.reader(src)
+                    next(rest, None)  # ヘッダー
+
+                    writer = csv.writer(dst)
+                    writer.writerow(fieldnames)
+                    writer.writerows(kept_rows)
+                    writer.writerows(rest)
+
+                    dst.flush()
+                    os.fsync(dst.fileno())
+                os.replace(merged_file, tmp_file)
+
+            # バックアップを作成
+            # 同じファイルシステム上ではハードリンクにする（データのコピーが不要）
+            backup_file = csv_file + '.backup'
+            if os.path.exists(backup_file):
+                os.remove(backup_file)
+            try:
+                os.link(csv_file, backup_file)
+            except OSError:
+                # ハードリンク非対応のファイルシステムではコピーする
+                shutil.copy2(csv_file, backup_file)
+            logger.info(f"バックアップを作成しました: {backup_file}")
+
+            # 残りの行を書き出した一時ファイルに置き換える（置き換えはアトミック）
+            os.replace(tmp_file, csv_file)
+            logger.info(f"CSVファイルを更新しました: 処理済み{processed_count}行を削除")
+
+        except Exception as e:
+            logger.error(f"CSVファイルの更新に失敗しました: {e}")
+            logger.error("バックアップファイルから復元してください")
+            self._remove_file(merged_file)
+            self._remove_file(tmp_file)
+
     def upload_from_csv_scheduled(self, csv_file, max_uploads=5, log_file=None):
         """
         CSVファイルから先頭N件をアップロードし、処理済み行を削除
@@ -269,16 +671,40 @@ class ShortsBatchUploader:
             os.makedirs(log_dir, exist_ok=True)
             log_file = os.path.join(log_dir, f'scheduled_upload_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
 
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file, encoding='utf-8'),
-                logging.StreamHandler()
-            ]
-        )
-
+        # このメソッド専用のハンドラーを追加し、終了時に必ず外して閉じる
+        # （同じプロセスで複数回呼ばれてもファイルを開いたままにせず、出力も重複させない）
         logger = logging.getLogger(__name__)
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        handlers = [
+            logging.FileHandler(log_file, encoding='utf-8'),
+            logging.StreamHandler()
+        ]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+        try:
+            return self._upload_from_csv_scheduled(csv_file, max_uploads, log_file, logger)
+        finally:
+            for handler in handlers:
+                logger.removeHandler(handler)
+                handler.close()
+
+    def _upload_from_csv_scheduled(self, csv_file, max_uploads, log_file, logger):
+        """
+        upload_from_csv_scheduled の本体（ログ設定済みのloggerを受け取る）
+
+        Args:
+            csv_file (str): CSVファイルのパス
+            max_uploads (int): 1回の実行で処理する最大件数
+            log_file (str): ログファイルのパス
+            logger (logging.Logger): 出力先のロガー
+
+        Returns:
+            dict: 実行結果のサマリー
+        """
         logger.info("=" * 60)
         logger.info("スケジュール実行バッチアップロード開始")
         logger.info(f"CSVファイル: {csv_file}")
@@ -291,130 +717,170 @@ class ShortsBatchUploader:
             return {'success': False, 'error': 'CSV file not found'}
 
         # CSVファイルを読み込み
+        # 今回処理する行だけを読み込み、残りの行はそのまま一時ファイルへ書き出す
+        # （処理する行も元の内容を残しておき、中断された場合は未処理の行をCSVに戻す）
+        tmp_file = csv_file + '.tmp'
+        remaining_count = 0
         try:
-            with open(csv_file, 'r', encoding='utf-8') as f:
+            with open(csv_file, 'r', newline='', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
-                all_rows = list(reader)
                 fieldnames = reader.fieldnames
+                raw_rows = list(itertools.islice((raw_row for raw_row in reader.reader if raw_row), max_uploads))
+                rows_to_process = [dict(zip(fieldnames, raw_row)) for raw_row in raw_rows]
+
+                if rows_to_process:
+                    with open(tmp_file, 'w', newline='', encoding='utf-8') as tmp:
+                        writer = csv.writer(tmp)
+                        writer.writerow(reader.fieldnames)
+                        # DictReaderの元のreaderから読み、行の内容を変えずにコピーする
+                        for raw_row in reader.reader:
+                            if raw_row:
+                                writer.writerow(raw_row)
+                                remaining_count += 1
+
+                        # 置き換え前に内容をディスクへ確定させる
+                        tmp.flush()
+                        os.fsync(tmp.fileno())
         except Exception as e:
             logger.error(f"CSVファイルの読み込みに失敗: {e}")
+            self._remove_file(tmp_file)
             return {'success': False, 'error': str(e)}
 
-        if not all_rows:
+        if not rows_to_process:
             logger.info("CSVファイルにデータがありません。すべてのアップロードが完了しています。")
             return {'success': True, 'uploaded': 0, 'remaining': 0, 'message': 'All uploads completed'}
 
-        # 処理する行数を決定
-        rows_to_process = all_rows[:max_uploads]
-        remaining_rows = all_rows[max_uploads:]
-
-        logger.info(f"CSV内の総行数: {len(all_rows)}")
+        logger.info(f"CSV内の総行数: {len(rows_to_process) + remaining_count}")
         logger.info(f"今回処理する行数: {len(rows_to_process)}")
-        logger.info(f"処理後の残り行数: {len(remaining_rows)}")
+        logger.info(f"処理後の残り行数: {remaining_count}")
         logger.info("")
 
-        # アップロード結果
+        # アップロード結果（CSVの行順に格納する）
         success_count = 0
         failed_count = 0
-        results = []
+        results = [None] * len(rows_to_process)
 
-        # 各行を処理
-        for i, row in enumerate(rows_to_process, 1):
-            logger.info(f"[{i}/{len(rows_to_process)}] 処理中: {row.get('file', 'N/A')}")
+        # 結果が出た行（成功・失敗）だけをCSVから削除する
+        # 中断された場合も finally で更新し、アップロード済みの行を次回また処理しないようにする
+        try:
+            # 動画ファイルの存在をまとめて確認
+            # ネットワークドライブ上のファイルでも待ち時間が重なるよう、並行して確認する
+            video_paths = [row.get('file') for row in rows_to_process]
+            check_paths = sorted({path for path in video_paths if path})
+            with ThreadPoolExecutor(max_workers=min(EXISTS_CHECK_WORKERS, max(1, len(check_paths)))) as executor:
+                file_exists = dict(zip(check_paths, executor.map(os.path.exists, check_paths)))
+
+            # 各行のメタデータを準備
+            jobs = []
+            job_rows = []
+            for i, row in enumerate(rows_to_process, 1):
+                try:
+                    video_file = row['file']
+
+                    # ファイルの存在確認
+                    if not file_exists.get(video_file, False):
+                        logger.warning(f"[{i}/{len(rows_to_process)}] 動画ファイルが見つかりません: {video_file}")
+                        failed_count += 1
+                        results[i - 1] = {
+                            'file': video_file,
+                            'status': 'failed',
+                            'error': 'File not found'
+                        }
+                        continue
+
+                    # 再生リスト処理
+                    playlist_id = None
+                    if 'playlist_name' in row and row['playlist_name']:
+                        playlist_id = self._resolve_playlist(row['playlist_name'])
+                        if not playlist_id:
+                            logger.warning(f"再生リスト '{row['playlist_name']}' が見つかりません。")
+                            logger.warning("動画は再生リストなしでアップロードされます。")
 
-            try:
-                video_file = row['file']
+                    jobs.append((video_file, self.row_to_metadata(row, playlist_id)))
+                    job_rows.append(i)
 
-                # ファイルの存在確認
-                if not os.path.exists(video_file):
-                    logger.warning(f"動画ファイルが見つかりません: {video_file}")
+                except Exception as e:
+                    logger.error(f"エラーが発生しました: {e}")
                     failed_count += 1
-                    results.append({
-                        'file': video_file,
+                    results[i - 1] = {
+                        'file': row.get('file', 'N/A'),
                         'status': 'failed',
-                        'error': 'File not found'
-                    })
-                    continue
-
-                # タグをリストに変換
-                tags = []
-                if 'tags' in row and row['tags']:
-                    tags = [tag.strip() for tag in row['tags'].split(',')]
-
-                # 再生リスト処理
-                playlist_id = None
-                if 'playlist_name' in row and row['playlist_name']:
-                    playlist_id = self.playlist_manager.get_playlist(row['playlist_name'])
-                    if not playlist_id:
-                        logger.warning(f"再生リスト '{row['playlist_name']}' が見つかりません。")
-                        logger.warning("動画は再生リストなしでアップロードされます。")
-
-                # メタデータ構築
-                metadata = {
-                    'title': row.get('title', ''),
-                    'description': row.get('description', ''),
-                    'tags': tags,
-                    'category_id': row.get('category_id', '22'),
-                    'privacy_status': row.get('privacy_status', 'public'),
-                    'playlist_id': playlist_id,
-                    'publish_at': row.get('publish_at', None)
-                }
+                        'error': str(e)
+                    }
+
+            if self.max_workers > 1:
+                logger.info(f"同時アップロード数: {self.max_workers}")
 
-                # アップロード実行
-                result = upload_with_retry(self.youtube, video_file, metadata)
+            def log_header(number, video_file):
+                logger.info(f"[{job_rows[number - 1]}/{len(rows_to_process)}] 処理中: {video_file}")
+
+            # 各動画をアップロード
+            # （再生リストへの追加は途中でも50件ごとに実行されるため、累計の差分で件数を数える）
+            playlist_added_before = self.playlist_ops_added
+            playlist_failed_before = self.playlist_ops_failed
+
+            def handle_result(number, video_file, metadata, result):
+                nonlocal success_count, failed_count
+                row_index = job_rows[number - 1] - 1
 
                 if result:
                     logger.info(f"✓ アップロード成功: {result['id']}")
                     logger.info(f"  URL: {result['url']}")
                     success_count += 1
-                    results.append({
+                    self._record_history({
+                        'file': video_file,
+                        'video_id': result['id'],
+                        'title': result['title'],
+                        'url': result['url'],
+                        'uploaded_at': datetime.now().isoformat(),
+                        'scheduled_for': metadata.get('publish_at') or '',
+                        'privacy_status': result['privacy_status']
+                    })
+                    results[row_index] = {
                         'file': video_file,
                         'status': 'success',
                         'video_id': result['id'],
                         'url': result['url']
-                    })
+                    }
                 else:
                     logger.error(f"✗ アップロード失敗: {video_file}")
                     failed_count += 1
-                    results.append({
+                    results[row_index] = {
                         'file': video_file,
                         'status': 'failed',
                         'error': 'Upload failed'
-                    })
-
-            except Exception as e:
-                logger.error(f"エラーが発生しました: {e}")
-                failed_count += 1
-                results.append({
-                    'file': row.get('file', 'N/A'),
-                    'status': 'failed',
-                    'error': str(e)
-                })
-
-            # API制限を考慮して待機
-            if i < len(rows_to_process):
-                wait_time = 10
-                logger.info(f"{wait_time}秒待機...")
-                time.sleep(wait_time)
-
-        # CSVファイルを更新（処理済み行を削除）
-        try:
-            # バックアップを作成
-            backup_file = csv_file + '.backup'
-            shutil.copy2(csv_file, backup_file)
-            logger.info(f"バックアップを作成しました: {backup_file}")
-
-            # 残りの行でCSVを上書き
-            with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(remaining_rows)
-
-            logger.info(f"CSVファイルを更新しました: 処理済み{len(rows_to_process)}行を削除")
+                    }
 
-        except Exception as e:
-            logger.error(f"CSVファイルの更新に失敗しました: {e}")
-            logger.error("バックアップファイルから復元してください")
+            # 中断後に完了したアップロードも履歴と結果に残す
+            uploads = self._iter_uploads(jobs, on_start=log_header, on_late_result=handle_result)
+            try:
+                consecutive_failures = 0
+                for n, ((video_file, metadata), result) in enumerate(zip(jobs, uploads), 1):
+                    handle_result(n, video_file, metadata, result)
+                    consecutive_failures = 0 if result else consecutive_failures + 1
+
+                    # 失敗が続いている場合は待機（順番に処理する場合のみ）
+                    wait_time = _upload_backoff(consecutive_failures)
+                    if self.max_workers == 1 and wait_time and n < len(jobs):
+                        logger.info(f"{wait_time:.1f}秒待機...")
+                        time.sleep(wait_time)
+            finally:
+                # 実行中のアップロードの完了を待ってから、再生リストへの追加をまとめて実行
+                # （中断された場合も、アップロード済みの分は追加する）
+                uploads.close()
+                if self._pending_playlist_ops:
+                    logger.info("再生リストに追加しています...")
+                    self.flush_playlist_ops()
+
+                added = self.playlist_ops_added - playlist_added_before
+                playlist_failed = self.playlist_ops_failed - playlist_failed_before
+                if added or playlist_failed:
+                    logger.info(f"再生リストへの追加: 成功 {added}件 / 失敗 {playlist_failed}件")
+        finally:
+            kept_rows = [raw_row for raw_row, result in zip(raw_rows, results) if result is None]
+            remaining_count += len(kept_rows)
+            self._update_scheduled_csv(csv_file, tmp_file, fieldnames, kept_rows,
+                                       len(rows_to_process) - len(kept_rows), logger)
 
         # サマリー
         logger.info("")
@@ -423,18 +889,18 @@ class ShortsBatchUploader:
         logger.info("=" * 60)
         logger.info(f"成功: {success_count}")
         logger.info(f"失敗: {failed_count}")
-        logger.info(f"残りの動画数: {len(remaining_rows)}")
+        logger.info(f"残りの動画数: {remaining_count}")
         logger.info(f"ログファイル: {log_file}")
         logger.info("=" * 60)
 
-        if len(remaining_rows) == 0:
+        if remaining_count == 0:
             logger.info("🎉 すべての動画のアップロードが完了しました！")
 
         return {
             'success': True,
             'uploaded': success_count,
             'failed': failed_count,
-            'remaining': len(remaining_rows),
+            'remaining': remaining_count,
             'log_file': log_file,
             'results': results
         }
@@ -3,7 +3,15 @@ YouTube 再生リスト管理モジュール
 再生リストの作成、検索、動画の追加を行います。
 """
 
-from googleapiclient.errors import HttpError
+import time
+
+# googleapiclient は読み込みが重いため、API を呼び出す関数の中でインポートする
+
+# 再生リスト一覧（タイトル -> ID）を取得し直すまでの秒数
+PLAYLIST_INDEX_TTL = 300
+
+# バッチリクエスト1回にまとめられるリクエスト数の上限（YouTube Data APIの制限）
+PLAYLIST_BATCH_SIZE = 50
 
 
 class PlaylistManager:
@@ -17,32 +25,90 @@ class PlaylistManager:
             youtube_client: YouTube API クライアント
         """
         self.youtube = youtube_client
-        self.playlist_cache = {}  # プレイリスト名 -> プレイリストID のキャッシュ
+        self._playlist_index = None  # 自分の再生リスト全件の タイトル -> ID
+        self._playlist_index_expires = 0
+        self._ttl = PLAYLIST_INDEX_TTL
+
+    def _iter_playlists(self, part):
+        """
+        自分の再生リストをページをたどって1件ずつ返す
+
+        Args:
+            part (str): 取得するリソースのパート
+
+        Yields:
+            dict: APIが返す再生リストリソース
+
+        Raises:
+            HttpError: API呼び出しが失敗した場合
+        """
+        request = self.youtube.playlists().list(
+            part=part,
+            mine=True,
+            maxResults=50
+        )
+
+        while request:
+            response = request.execute()
+            yield from response.get('items', [])
+
+            # 次のページがあれば取得
+            request = self.youtube.playlists().list_next(request, response)
+
+    def _set_index(self, index):
+        """
+        タイトル -> ID の索引を置き換え、有効期限を延ばす
+
+        Args:
+            index (dict): タイトル -> 再生リストID
+        """
+        self._playlist_index = index
+        self._playlist_index_expires = time.monotonic() + self._ttl
+
+    def _ensure_index(self):
+        """
+        索引が無いか期限切れの場合だけ、自分の再生リストを全件取得して作り直す
+
+        Returns:
+            bool: 有効な索引がある場合True
+        """
+        from googleapiclient.errors import HttpError
+
+        if self._playlist_index is not None and time.monotonic() <= self._playlist_index_expires:
+            return True
+
+        index = {}
+        try:
+            for item in self._iter_playlists('snippet'):
+                # 同名の再生リストが複数ある場合は最初に見つかったものを使う
+                index.setdefault(item['snippet']['title'], item['id'])
+        except HttpError as e:
+            # 索引は更新せず、次回の検索で再取得する
+            print(f"再生リストの検索に失敗しました: {e}")
+            return False
+
+        self._set_index(index)
+        return True
+
+    def clear_cache(self):
+        """
+        再生リストの索引を破棄し、次回の検索で取得し直す
+        """
+        self._playlist_index = None
 
     def get_playlist(self, playlist_name):
         """
         再生リストを取得（見つからない場合はNoneを返す）
 
+        索引は PLAYLIST_INDEX_TTL 秒ごとに取得し直すため、名前の変更や削除も反映される
+
         Args:
             playlist_name (str): 再生リスト名
 
         Returns:
             str: 再生リストID、見つからない場合はNone
         """
-        # キャッシュをチェック
-        if playlist_name in self.playlist_cache:
-            return self.playlist_cache[playlist_name]
-
-        # 既存の再生リストを検索
-        playlist_id = self.find_playlist_by_name(playlist_name)
-
-        if playlist_id:
-            # 見つかった場合はキャッシュに保存
-            self.playlist_cache[playlist_name] = playlist_id
-            return playlist_id
-
-        # 見つからない場合はNoneを返す
-        return None
+        return self.find_playlist_by_name(playlist_name)
 
     def get_or_create_playlist(self, playlist_name, description=None, privacy_status='public'):
         """
@@ -64,17 +130,13 @@ class PlaylistManager:
 
         # 見つからない場合は新規作成
         print(f"再生リスト '{playlist_name}' が見つかりません。新規作成します...")
-        playlist_id = self.create_playlist(
+        # 作成した再生リストは create_playlist が索引に追加する
+        return self.create_playlist(
             playlist_name,
             description or f"YouTube Shorts: {playlist_name}",
             privacy_status
         )
 
-        if playlist_id:
-            self.playlist_cache[playlist_name] = playlist_id
-
-        return playlist_id
-
     def find_playlist_by_name(self, playlist_name):
         """
         再生リストを名前で検索
@@ -85,31 +147,14 @@ class PlaylistManager:
         Returns:
             str: 再生リストID、見つからない場合はNone
         """
-        try:
-            # 自分の再生リストを取得
-            request = self.youtube.playlists().list(
-                part='snippet',
-                mine=True,
-                maxResults=50
-            )
-
-            while request:
-                response = request.execute()
-
-                for item in response.get('items', []):
-                    if item['snippet']['title'] == playlist_name:
-                        playlist_id = item['id']
-                        print(f"既存の再生リスト '{playlist_name}' を見つけました (ID: {playlist_id})")
-                        return playlist_id
-
-                # 次のページがあれば取得
-                request = self.youtube.playlists().list_next(request, response)
-
+        if not self._ensure_index():
             return None
 
-        except HttpError as e:
-            print(f"再生リストの検索に失敗しました: {e}")
-            return None
+        playlist_id = self._playlist_index.get(playlist_name)
+        if playlist_id:
+            print(f"既存の再生リスト '{playlist_name}' を見つけました (ID: {playlist_id})")
+
+        return playlist_id
 
     def create_playlist(self, title, description, privacy_status='public'):
         """
@@ -123,6 +168,8 @@ class PlaylistManager:
         Returns:
             str: 作成した再生リストID、失敗した場合はNone
         """
+        from googleapiclient.errors import HttpError
+
         try:
             request = self.youtube.playlists().insert(
                 part='snippet,status',
@@ -140,6 +187,10 @@ class PlaylistManager:
             response = request.execute()
             playlist_id = response['id']
 
+            # 作成した再生リストを索引にも反映する
+            if self._playlist_index is not None:
+                self._playlist_index.setdefault(title, playlist_id)
+
             print(f"再生リスト '{title}' を作成しました (ID: {playlist_id})")
             return playlist_id
 
@@ -159,6 +210,8 @@ class PlaylistManager:
         Returns:
             bool: 成功した場合True
         """
+        from googleapiclient.errors import HttpError
+
         try:
             body = {
                 'snippet': {
@@ -186,6 +239,65 @@ class PlaylistManager:
             print(f"動画を再生リストに追加できませんでした: {e}")
             return False
 
+    def batch_add_videos(self, items):
+        """
+        複数の動画をバッチリクエストでまとめて再生リストに追加
+
+        最大50件ずつ1回のHTTPリクエストにまとめる（クォータ消費量は1件ずつ追加する場合と同じ）
+
+        Args:
+            items (list): (再生リストID, 動画ID) のタプルのリスト
+
+        Returns:
+            tuple: (追加に成功した件数, 失敗した件数)
+        """
+        added = 0
+        failed = 0
+        requests = {}
+
+        def callback(request_id, response, exception):
+            nonlocal added, failed
+            playlist_id, video_id = requests.pop(request_id)
+            if exception is not None:
+                failed += 1
+                print(f"動画 {video_id} を再生リスト (ID: {playlist_id}) に追加できませんでした: {exception}")
+            else:
+                added += 1
+                print(f"動画 {video_id} を再生リスト (ID: {playlist_id}) に追加しました")
+
+        for start in range(0, len(items), PLAYLIST_BATCH_SIZE):
+            chunk = items[start:start + PLAYLIST_BATCH_SIZE]
+
+            requests.clear()
+            batch = self.youtube.new_batch_http_request(callback=callback)
+            for i, (playlist_id, video_id) in enumerate(chunk):
+                request_id = str(i)
+                requests[request_id] = (playlist_id, video_id)
+                batch.add(
+                    self.youtube.playlistItems().insert(
+                        part='snippet',
+                        body={
+                            'snippet': {
+                                'playlistId': playlist_id,
+                                'resourceId': {
+                                    'kind': 'youtube#video',
+                                    'videoId': video_id
+                                }
+                            }
+                        }
+                    ),
+                    request_id=request_id
+                )
+
+            try:
+                batch.execute()
+            except Exception as e:
+                # コールバックが呼ばれなかったリクエストを失敗として数える
+                failed += len(requests)
+                print(f"再生リストへの追加に失敗しました: {e}")
+
+        return added, failed
+
     def list_playlists(self):
         """
         自分の再生リスト一覧を取得
@@ -193,35 +305,30 @@ class PlaylistManager:
         Returns:
             list: 再生リスト情報のリスト
         """
+        from googleapiclient.errors import HttpError
+
         playlists = []
+        index = {}
 
         try:
-            request = self.youtube.playlists().list(
-                part='snippet,contentDetails',
-                mine=True,
-                maxResults=50
-            )
-
-            while request:
-                response = request.execute()
-
-                for item in response.get('items', []):
-                    playlists.append({
-                        'id': item['id'],
-                        'title': item['snippet']['title'],
-                        'description': item['snippet'].get('description', ''),
-                        'item_count': item['contentDetails']['itemCount'],
-                        'privacy_status': item.get('status', {}).get('privacyStatus', 'unknown')
-                    })
-
-                request = self.youtube.playlists().list_next(request, response)
-
-            return playlists
+            for item in self._iter_playlists('snippet,contentDetails,status'):
+                playlists.append({
+                    'id': item['id'],
+                    'title': item['snippet']['title'],
+                    'description': item['snippet'].get('description', ''),
+                    'item_count': item['contentDetails']['itemCount'],
+                    'privacy_status': item.get('status', {}).get('privacyStatus', 'unknown')
+                })
+                index.setdefault(item['snippet']['title'], item['id'])
 
         except HttpError as e:
             print(f"再生リスト一覧の取得に失敗しました: {e}")
             return []
 
+        # 取得した一覧で名前検索用の索引も更新する
+        self._set_index(index)
+        return playlists
+
 
 if __name__ == '__main__':
     # テスト用コード
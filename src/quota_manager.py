@@ -4,20 +4,29 @@ API使用量を追跡し、1日の上限を管理します。
 """
 
 import os
+import time
 import json
+import atexit
+from types import MappingProxyType
 from datetime import datetime, timedelta
 
+# 動画アップロード（video.insert）1回のコスト
+VIDEO_INSERT_COST = 1600
+
 
 class QuotaManager:
     """YouTube API クォータ管理クラス"""
 
-    # YouTube Data API v3のコスト
-    API_COSTS = {
-        'video.insert': 1600,  # 動画アップロード
-        'video.list': 1,       # 動画情報取得
-        'video.update': 50,    # 動画情報更新
-        'channel.list': 1,     # チャンネル情報取得
-    }
+    # YouTube Data API v3のコスト（読み取り専用）
+    API_COSTS = MappingProxyType({
+        'video.insert': VIDEO_INSERT_COST,  # 動画アップロード
+        'video.list': 1,                    # 動画情報取得
+        'video.update': 50,                 # 動画情報更新
+        'channel.list': 1,                  # チャンネル情報取得
+    })
+
+    # 何回の use_quota ごとに状態ファイルへ書き込むか
+    FLUSH_EVERY = 10
 
     def __init__(self, daily_limit=10000, state_file='quota_state.json'):
         """
@@ -31,30 +40,45 @@ class QuotaManager:
         self.state_file = state_file
         self.current_usage = 0
         self.reset_time = None
+        self._reset_deadline = None  # リセット時刻に相当する time.monotonic() の値
+        self._dirty_ops = 0  # 状態ファイルに未保存の use_quota の回数
+        self._persisted = None  # 状態ファイルの内容 (使用量, リセット時刻, 上限)
+        self._flush_every = self.FLUSH_EVERY
 
         # 状態をロード
         self.load_quota_state()
 
+        # 未保存の使用量はプロセス終了時に保存する
+        atexit.register(self.flush)
+
     def load_quota_state(self):
         """
         保存された状態をロード
         """
-        if not os.path.exists(self.state_file):
+        # ファイルが無い・空の場合は読み込まずにリセットする
+        try:
+            empty = os.stat(self.state_file).st_size == 0
+        except FileNotFoundError:
+            empty = True
+
+        if empty:
             self.reset_quota()
             return
 
         try:
-            with open(self.state_file, 'r') as f:
-                state = json.load(f)
+            with open(self.state_file, 'rb') as f:
+                state = json.loads(f.read())
 
             self.current_usage = state.get('current_usage', 0)
             reset_time_str = state.get('reset_time')
 
             if reset_time_str:
                 self.reset_time = datetime.fromisoformat(reset_time_str)
+                self._persisted = (self.current_usage, self.reset_time, state.get('daily_limit'))
+                self._set_reset_deadline()
 
                 # リセット時刻を過ぎている場合はリセット
-                if datetime.now() >= self.reset_time:
+                if self.get_reset_time_remaining() <= timedelta(0):
                     self.reset_quota()
             else:
                 self.reset_quota()
@@ -76,12 +100,30 @@ class QuotaManager:
         if now >= self.reset_time:
             self.reset_time += timedelta(days=1)
 
+        self._set_reset_deadline(now)
         self.save_quota_state()
 
+    def _set_reset_deadline(self, now=None):
+        """
+        リセット時刻までの残り時間を time.monotonic() 基準の期限に変換して保持
+
+        以降の残り時間の計算はシステム時刻の変更（NTPによる補正など）の影響を受けない
+
+        Args:
+            now (datetime): 現在時刻（Noneの場合は取得する）
+        """
+        now = now or datetime.now()
+        self._reset_deadline = time.monotonic() + (self.reset_time - now).total_seconds()
+
     def save_quota_state(self):
         """
-        現在の状態を保存
+        現在の状態を保存（ファイルの内容から変わっていない場合は書き込まない）
         """
+        current = (self.current_usage, self.reset_time, self.daily_limit)
+        if current == self._persisted:
+            self._dirty_ops = 0
+            return
+
         state = {
             'current_usage': self.current_usage,
             'reset_time': self.reset_time.isoformat() if self.reset_time else None,
@@ -89,12 +131,24 @@ class QuotaManager:
             'last_updated': datetime.now().isoformat()
         }
 
+        # 一時ファイルに書いてから置き換える（書き込み中に終了しても元のファイルが壊れない）
+        tmp_file = self.state_file + '.tmp'
         try:
-            with open(self.state_file, 'w') as f:
+            with open(tmp_file, 'w') as f:
                 json.dump(state, indent=2, fp=f)
+            os.replace(tmp_file, self.state_file)
+            self._dirty_ops = 0
+            self._persisted = current
         except Exception as e:
             print(f"警告: 状態の保存に失敗しました: {e}")
 
+    def flush(self):
+        """
+        未保存の使用量があれば状態ファイルに保存
+        """
+        if self._dirty_ops:
+            self.save_quota_state()
+
     def can_upload(self, cost=None):
         """
         アップロードが可能かチェック
@@ -106,9 +160,14 @@ class QuotaManager:
             bool: アップロード可能な場合True
         """
         if cost is None:
-            cost = self.API_COSTS['video.insert']
+            cost = VIDEO_INSERT_COST
 
-        return (self.current_usage + cost) <= self.daily_limit
+        if (self.current_usage + cost) <= self.daily_limit:
+            return True
+
+        # 上限に達した時点の使用量は確実に残しておく
+        self.flush()
+        return False
 
     def use_quota(self, operation='video.insert', cost=None):
         """
@@ -127,10 +186,23 @@ class QuotaManager:
         if not self.can_upload(cost):
             return False
 
+        # 書き込みは一定回数ごとにまとめて行う（残りは flush() / 終了時に保存）
         self.current_usage += cost
-        self.save_quota_state()
+        self._dirty_ops += 1
+        if self._dirty_ops >= self._flush_every:
+            self.save_quota_state()
         return True
 
+    def refund(self, cost):
+        """
+        use_quota で確保したクォータを戻す（操作が失敗した場合に使う）
+
+        Args:
+            cost (int): 戻すコスト
+        """
+        self.current_usage = max(0, self.current_usage - cost)
+        self.save_quota_state()
+
     def get_remaining_quota(self):
         """
         残りのクォータを取得
@@ -147,7 +219,7 @@ class QuotaManager:
         Returns:
             int: 残りのアップロード回数
         """
-        upload_cost = self.API_COSTS['video.insert']
+        upload_cost = VIDEO_INSERT_COST
         return self.get_remaining_quota() // upload_cost
 
     def get_reset_time_remaining(self):
@@ -157,11 +229,10 @@ class QuotaManager:
         Returns:
             timedelta: リセットまでの時間
         """
-        if not self.reset_time:
+        if self._reset_deadline is None:
             return timedelta(0)
 
-        remaining = self.reset_time - datetime.now()
-        return remaining if remaining.total_seconds() > 0 else timedelta(0)
+        return timedelta(seconds=max(0.0, self._reset_deadline - time.monotonic()))
 
     def print_status(self):
         """
@@ -207,7 +278,7 @@ def check_quota_before_upload(quota_manager, count=1):
     """
     def decorator(func):
         def wrapper(*args, **kwargs):
-            upload_cost = QuotaManager.API_COSTS['video.insert'] * count
+            upload_cost = VIDEO_INSERT_COST * count
 
             if not quota_manager.can_upload(upload_cost):
                 remaining = quota_manager.get_remaining_uploads()
@@ -223,11 +294,17 @@ def check_quota_before_upload(quota_manager, count=1):
                     f"リセットまで: {hours}時間{minutes}分"
                 )
 
-            # 実行前にクォータを確保
+            # 実行前にクォータを確保し、失敗した場合（例外・Noneを返した場合）は戻す
             quota_manager.use_quota('video.insert', upload_cost)
 
-            # 関数を実行
-            result = func(*args, **kwargs)
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                quota_manager.refund(upload_cost)
+                raise
+
+            if result is None:
+                quota_manager.refund(upload_cost)
 
             return result
 
@@ -3,10 +3,76 @@ YouTube Shorts アップロードモジュール
 動画のアップロードとエラーハンドリングを行います。
 """
 
+import re
+import sys
 import time
+import random
+from functools import lru_cache
+from types import MappingProxyType
 from datetime import datetime, timezone, timedelta
-from googleapiclient.http import MediaFileUpload
-from googleapiclient.errors import HttpError
+from .playlist_manager import PlaylistManager
+
+# googleapiclient は読み込みが重いため、API を呼び出す関数の中でインポートする
+
+# 日本時間（UTC+9）とUTC
+_JST = timezone(timedelta(hours=9))
+_UTC = timezone.utc
+
+# タイトル・説明文に含まれる #Shorts ハッシュタグ（大文字小文字を区別しない）
+# \b は仮名・漢字も単語の文字として扱い "#Shortsです" に一致しないため、英数字と _ だけで区切りを判定する
+_SHORTS_RE = re.compile(r'#shorts(?![0-9a-z_])', re.IGNORECASE)
+
+# レジュマブルアップロードで1回に送信するサイズ（再試行時は失敗したチャンクだけ送り直す）
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# アップロード進捗を表示する間隔（秒）
+PROGRESS_INTERVAL = 1.0
+
+# 端末以外（ファイルへのリダイレクト、タスクスケジューラー）では進捗を10%ごとに1行で出力する
+PROGRESS_STEP = 10
+_IS_TTY = sys.stdout is not None and sys.stdout.isatty()
+
+# アップロード中に再試行するHTTPステータス
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# 再試行までの待機時間の上限（秒）
+MAX_RETRY_WAIT = 120
+
+
+def _parse_jst_datetime(s):
+    """
+    "yyyy-mm-dd hh:mm:ss" / "yyyy-mm-dd hh:mm" 形式の文字列を日本時間のdatetimeに変換
+
+    決まった位置の数字を直接読み取る。形が合わない場合だけstrptimeで解析する
+
+    Args:
+        s (str): 日時文字列
+
+    Returns:
+        datetime: 日本時間のdatetime
+
+    Raises:
+        ValueError: 形式が不正な場合
+    """
+    length = len(s)
+    if length not in (16, 19):
+        raise ValueError(f"日時形式が不正です: {s}")
+
+    if (s[4] == '-' and s[7] == '-' and s[10] == ' ' and s[13] == ':'
+            and (length == 16 or s[16] == ':')):
+        digits = s[0:4] + s[5:7] + s[8:10] + s[11:13] + s[14:16] + s[17:19]
+        if digits.isdigit():
+            return datetime(
+                int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                int(s[11:13]), int(s[14:16]), int(s[17:19]) if length == 19 else 0,
+                tzinfo=_JST
+            )
+
+    if length == 19:
+        dt = datetime.strptime(s, "%Y-%m-%d %H:%M:%S")
+    else:
+        dt = datetime.strptime(s, "%Y-%m-%d %H:%M")
+    return dt.replace(tzinfo=_JST)
 
 
 def convert_jst_to_utc_iso8601(jst_datetime_str):
@@ -34,30 +100,63 @@ def convert_jst_to_utc_iso8601(jst_datetime_str):
 
     # 日時をパース（秒が省略されている場合も対応）
     try:
-        # "yyyy-mm-dd hh:mm:ss" 形式
-        if len(jst_datetime_str) == 19:
-            dt = datetime.strptime(jst_datetime_str, "%Y-%m-%d %H:%M:%S")
-        # "yyyy-mm-dd hh:mm" 形式
-        elif len(jst_datetime_str) == 16:
-            dt = datetime.strptime(jst_datetime_str, "%Y-%m-%d %H:%M")
-        else:
-            raise ValueError(f"日時形式が不正です: {jst_datetime_str}")
+        return _jst_to_utc_iso8601(jst_datetime_str)
     except ValueError as e:
         print(f"警告: 日時のパースに失敗しました: {e}")
         print(f"正しい形式: 'yyyy-mm-dd hh:mm:ss' または 'yyyy-mm-dd hh:mm'")
         return None
 
-    # 日本時間（UTC+9）として解釈
-    jst = timezone(timedelta(hours=9))
-    dt_jst = dt.replace(tzinfo=jst)
 
-    # UTCに変換
-    dt_utc = dt_jst.astimezone(timezone.utc)
+@lru_cache(maxsize=256)
+def _jst_to_utc_iso8601(jst_datetime_str):
+    """
+    日本時間の日時文字列をUTC ISO 8601形式に変換（結果をキャッシュする）
+
+    一括予約では同じ公開日時が何度も指定されるため、変換結果を使い回す。
+    形式が不正な場合の例外はキャッシュされない
+
+    Args:
+        jst_datetime_str (str): 前後の空白を除いた日本時間の日時文字列
+
+    Returns:
+        str: UTC ISO 8601形式の文字列
 
-    # ISO 8601形式に変換
+    Raises:
+        ValueError: 形式が不正な場合
+    """
+    dt_utc = _parse_jst_datetime(jst_datetime_str).astimezone(_UTC)
     return dt_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
+def _backoff(attempt, resp=None):
+    """
+    再試行までの待機時間を計算
+
+    レスポンスにRetry-Afterヘッダーがあればその秒数だけ待つ（指定より早くは再試行しない）。
+    その秒数が上限（120秒）を超える場合は待たずに再試行をやめる。
+    ヘッダーが無い場合は指数バックオフ（5秒, 10秒, 20秒...）の範囲からランダムに選び、
+    複数の実行が同時に再試行しないようにする（上限120秒）
+
+    Args:
+        attempt (int): 再試行の回数（0から）
+        resp: HttpErrorのレスポンス（無い場合はNone）
+
+    Returns:
+        float: 待機時間（秒）、再試行しない場合はNone
+    """
+    retry_after = resp.get('retry-after') if resp is not None else None
+    if retry_after:
+        try:
+            wait_time = max(0.0, float(retry_after))
+        except ValueError:
+            wait_time = None
+
+        if wait_time is not None:
+            return wait_time if wait_time <= MAX_RETRY_WAIT else None
+
+    return random.uniform(0, min(MAX_RETRY_WAIT, (2 ** attempt) * 5))
+
+
 def upload_shorts_video(
     youtube,
     video_file,
@@ -68,7 +167,9 @@ def upload_shorts_video(
     privacy_status='public',
     made_for_kids=False,
     publish_at=None,
-    playlist_id=None
+    playlist_id=None,
+    http=None,
+    playlist_manager=None
 ):
     """
     YouTube Shortsをアップロードする
@@ -84,6 +185,10 @@ def upload_shorts_video(
         made_for_kids (bool): 子供向けコンテンツかどうか
         publish_at (str): 公開日時（ISO 8601形式: "2025-11-20T10:00:00Z"）
         playlist_id (str): 追加する再生リストID
+        http: リクエストに使用するHTTPオブジェクト（Noneの場合はクライアント既定）
+              複数スレッドから同時にアップロードする場合はスレッドごとに指定する
+        playlist_manager (PlaylistManager): 再生リストへの追加に使うマネージャー
+              （Noneの場合はこの呼び出し用に作成する）
 
     Returns:
         dict: アップロード結果（動画ID、URL等）
@@ -91,11 +196,14 @@ def upload_shorts_video(
     Raises:
         HttpError: API呼び出しが失敗した場合
     """
+    from googleapiclient.http import MediaFileUpload
+    from googleapiclient.errors import HttpError
+
     # Shortsとして認識させるため、タイトルまたは説明文に#Shortsを追加
-    if '#Shorts' not in title and '#shorts' not in title:
+    if not _SHORTS_RE.search(title):
         title = f"{title} #Shorts"
 
-    if '#Shorts' not in description and '#shorts' not in description:
+    if not _SHORTS_RE.search(description):
         description = f"{description}\n\n#Shorts"
 
     # リクエストボディの構築
@@ -127,10 +235,10 @@ def upload_shorts_video(
             print(f"スケジュール公開は設定されません")
 
     # メディアファイルのアップロード設定
-    # chunksize=-1 は、ファイル全体を一度にアップロードすることを意味します
+    # 8MiBずつ送信する（ファイル全体をメモリに載せず、失敗したチャンクだけ再送する）
     media = MediaFileUpload(
         video_file,
-        chunksize=-1,
+        chunksize=UPLOAD_CHUNK_SIZE,
         resumable=True,
         mimetype='video/mp4'
     )
@@ -149,23 +257,32 @@ def upload_shorts_video(
     response = None
     error = None
     retry = 0
+    last_print = 0.0
+    next_progress = PROGRESS_STEP
 
     # チャンク単位でアップロードを実行
     while response is None:
         try:
-            status, response = request.next_chunk()
+            status, response = request.next_chunk(http=http)
             if status:
                 progress = int(status.progress() * 100)
-                print(f"アップロード進捗: {progress}%", end='\r')
+                if _IS_TTY:
+                    if time.monotonic() - last_print >= PROGRESS_INTERVAL:
+                        print(f"アップロード進捗: {progress}%", end='\r', flush=True)
+                        last_print = time.monotonic()
+                elif progress >= next_progress:
+                    print(f"アップロード進捗: {progress}%")
+                    next_progress = (progress // PROGRESS_STEP + 1) * PROGRESS_STEP
         except HttpError as e:
-            if e.resp.status in [500, 502, 503, 504]:
-                # サーバーエラーの場合は再試行
-                error = f"サーバーエラー ({e.resp.status})"
+            if e.resp.status in RETRYABLE_STATUS_CODES:
+                # サーバーエラー・レート制限の場合は再試行
+                kind = 'レート制限' if e.resp.status == 429 else 'サーバーエラー'
+                error = f"{kind} ({e.resp.status})"
                 retry += 1
-                if retry > 5:
+                wait_time = _backoff(retry, e.resp)
+                if retry > 5 or wait_time is None:
                     raise
-                wait_time = retry * 5
-                print(f"\n{error}。{wait_time}秒後に再試行します...")
+                print(f"\n{error}。{wait_time:.1f}秒後に再試行します...")
                 time.sleep(wait_time)
             else:
                 raise
@@ -174,11 +291,12 @@ def upload_shorts_video(
     print(f"動画ID: {response['id']}")
     print(f"URL: https://youtube.com/shorts/{response['id']}")
     print(f"管理URL: https://studio.youtube.com/video/{response['id']}/edit")
+    sys.stdout.flush()
 
     # 再生リストに追加
     if playlist_id:
-        from .playlist_manager import PlaylistManager
-        playlist_manager = PlaylistManager(youtube)
+        if playlist_manager is None:
+            playlist_manager = PlaylistManager(youtube)
         if playlist_manager.add_video_to_playlist(playlist_id, response['id']):
             print(f"再生リスト (ID: {playlist_id}) に追加しました")
 
@@ -191,7 +309,8 @@ def upload_shorts_video(
     }
 
 
-def upload_with_retry(youtube, video_file, metadata, max_retries=3):
+def upload_with_retry(youtube, video_file, metadata, max_retries=3, http=None,
+                      playlist_manager=None):
     """
     再試行ロジック付きアップロード
 
@@ -200,10 +319,19 @@ def upload_with_retry(youtube, video_file, metadata, max_retries=3):
         video_file (str): 動画ファイルのパス
         metadata (dict): 動画のメタデータ
         max_retries (int): 最大再試行回数
+        http: リクエストに使用するHTTPオブジェクト（upload_shorts_videoに渡される）
+        playlist_manager (PlaylistManager): 再生リストへの追加に使うマネージャー
+              （Noneの場合は再試行をまたいで使う1つを作成する）
 
     Returns:
         dict: アップロード結果、失敗した場合はNone
     """
+    from googleapiclient.errors import HttpError
+
+    # 再試行のたびにマネージャーを作り直さない
+    if playlist_manager is None and metadata.get('playlist_id'):
+        playlist_manager = PlaylistManager(youtube)
+
     for attempt in range(max_retries):
         try:
             return upload_shorts_video(
@@ -216,7 +344,9 @@ def upload_with_retry(youtube, video_file, metadata, max_retries=3):
                 metadata.get('privacy_status', 'public'),
                 metadata.get('made_for_kids', False),
                 metadata.get('publish_at'),
-                metadata.get('playlist_id')
+                metadata.get('playlist_id'),
+                http=http,
+                playlist_manager=playlist_manager
             )
 
         except HttpError as e:
@@ -253,10 +383,14 @@ def upload_with_retry(youtube, video_file, metadata, max_retries=3):
                     print("エラー: 動画ファイルが無効です。")
                     break
 
-            # 500系サーバーエラー
-            elif e.resp.status in [500, 502, 503, 504]:
-                wait_time = (2 ** attempt) * 5  # 指数バックオフ
-                print(f"サーバーエラー。{wait_time}秒後に再試行します...")
+            # 500系サーバーエラー・レート制限（429）
+            elif e.resp.status in RETRYABLE_STATUS_CODES:
+                wait_time = _backoff(attempt, e.resp)  # 指数バックオフ（ジッター付き）
+                if wait_time is None:
+                    print(f"エラー: サーバーが{e.resp.get('retry-after')}秒後の再試行を求めているため中止します。")
+                    print("時間をおいて再実行してください。")
+                    break
+                print(f"サーバーエラー。{wait_time:.1f}秒後に再試行します...")
                 time.sleep(wait_time)
                 continue
 
@@ -268,8 +402,8 @@ def upload_with_retry(youtube, video_file, metadata, max_retries=3):
             print(f"試行 {attempt + 1}/{max_retries}")
 
             if attempt < max_retries - 1:
-                wait_time = 5
-                print(f"{wait_time}秒後に再試行します...")
+                wait_time = _backoff(attempt)
+                print(f"{wait_time:.1f}秒後に再試行します...")
                 time.sleep(wait_time)
             else:
                 break
@@ -277,8 +411,8 @@ def upload_with_retry(youtube, video_file, metadata, max_retries=3):
     return None
 
 
-# カテゴリIDの参考情報
-YOUTUBE_CATEGORIES = {
+# カテゴリIDの参考情報（読み取り専用）
+YOUTUBE_CATEGORIES = MappingProxyType({
     '1': 'Film & Animation',
     '2': 'Autos & Vehicles',
     '10': 'Music',
@@ -294,7 +428,7 @@ YOUTUBE_CATEGORIES = {
     '27': 'Education',
     '28': 'Science & Technology',
     '29': 'Nonprofits & Activism'
-}
+})
 
 
 if __name__ == '__main__':
@@ -4,8 +4,177 @@ YouTube Shorts 動画検証モジュール
 """
 
 import os
+import time
+import glob
+import fnmatch
+import atexit
 import subprocess
 import json
+import itertools
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# ディレクトリ検証で同時に実行するffprobeの数の上限
+# （ffprobeは起動と読み込みの待ちが大半のため、CPU数の4倍まで同時に実行する）
+VALIDATE_WORKERS = 16
+
+# ffprobeの結果を保存するファイル（ファイルのパス・サイズ・更新日時が同じなら再利用する）
+FFPROBE_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'shorts_validator', 'ffprobe.json')
+FFPROBE_CACHE_EXPIRATION = 14 * 24 * 60 * 60  # 2週間
+FFPROBE_CACHE_VERSION = 3  # ffprobeの引数を変えたら上げる
+
+# ffprobeで取得する項目（check_video_specs で使うもの）
+FFPROBE_ENTRIES = 'stream=width,height,codec_name,r_frame_rate:format=duration,size'
+
+
+# 検証の理由コードごとのメッセージ（ShortsValidator.format_messages で使う）
+_REASON_MESSAGES = {
+    'duration_exceeded': (
+        "✗ 動画の長さが{max_duration}秒を超えています（{duration:.1f}秒）",
+    ),
+    'duration_long': (
+        "⚠ 動画の長さが推奨される{recommended_duration}秒を超えています（{duration:.1f}秒）",
+    ),
+    'resolution_low': (
+        "⚠ 解像度が低いです（{width}x{height}）",
+        "  推奨: {min_resolution}p以上",
+    ),
+    'resolution_below_recommended': (
+        "⚠ 解像度が推奨値より低いです（{width}x{height}）",
+        "  推奨: {recommended_resolution}p以上",
+    ),
+    'aspect_ratio': (
+        "✗ アスペクト比が要件を満たしていません（{aspect_ratio_decimal}）",
+        "  推奨: 9:16（縦型）または 1:1（正方形）",
+    ),
+    'file_size': (
+        "✗ ファイルサイズが大きすぎます（{file_size_gb:.2f} GB）",
+    ),
+}
+
+
+def _classify_aspect(width, height):
+    """
+    アスペクト比を計算して縦型・正方形かを判定
+
+    Args:
+        width (int): 幅
+        height (int): 高さ（0以外）
+
+    Returns:
+        tuple: (アスペクト比（小数第3位まで）, 縦型か, 正方形か)
+    """
+    aspect_ratio = width / height
+    return round(aspect_ratio, 3), aspect_ratio < 1, abs(aspect_ratio - 1.0) < 0.1
+
+
+# よく使われるShortsの解像度は判定結果を事前に計算しておく
+_KNOWN_ASPECTS = {
+    dims: _classify_aspect(*dims)
+    for dims in [(1080, 1920), (720, 1280), (1080, 1080), (540, 960), (1440, 2560), (2160, 3840)]
+}
+
+
+class _ProbeCache:
+    """ffprobe結果のファイルキャッシュ"""
+
+    def __init__(self, cache_file):
+        """
+        初期化
+
+        Args:
+            cache_file (str): キャッシュファイルのパス
+        """
+        self.cache_file = cache_file
+        self._entries = None  # 絶対パス -> {'size', 'mtime_ns', 'cached_at', 'info'}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        """
+        キャッシュファイルを読み込む（初回のみ）
+        """
+        if self._entries is not None:
+            return
+
+        self._entries = {}
+        try:
+            with open(self.cache_file, 'rb') as f:
+                data = json.loads(f.read())
+            if data.get('version') == FFPROBE_CACHE_VERSION:
+                self._entries = data.get('entries', {})
+        except (OSError, ValueError, AttributeError):
+            # 無い・壊れている場合は空のキャッシュから始める
+            pass
+
+        atexit.register(self.save)
+
+    def get(self, path, st):
+        """
+        キャッシュされたffprobeの結果を取得
+
+        Args:
+            path (str): 動画ファイルの絶対パス
+            st (os.stat_result): 動画ファイルの情報
+
+        Returns:
+            dict: ffprobeの結果、無い・古い場合はNone
+        """
+        with self._lock:
+            self._load()
+            entry = self._entries.get(path)
+
+        if (entry is None or entry.get('size') != st.st_size
+                or entry.get('mtime_ns') != st.st_mtime_ns
+                or time.time() - entry.get('cached_at', 0) > FFPROBE_CACHE_EXPIRATION):
+            return None
+
+        return entry.get('info')
+
+    def put(self, path, st, info):
+        """
+        ffprobeの結果をキャッシュに追加
+
+        Args:
+            path (str): 動画ファイルの絶対パス
+            st (os.stat_result): 動画ファイルの情報
+            info (dict): ffprobeの結果
+        """
+        with self._lock:
+            self._load()
+            self._entries[path] = {
+                'size': st.st_size,
+                'mtime_ns': st.st_mtime_ns,
+                'cached_at': time.time(),
+                'info': info
+            }
+            self._dirty = True
+
+    def save(self):
+        """
+        変更があればキャッシュファイルに保存（期限切れのエントリは削除する）
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+
+            now = time.time()
+            entries = {
+                path: entry for path, entry in self._entries.items()
+                if now - entry.get('cached_at', 0) <= FFPROBE_CACHE_EXPIRATION
+            }
+
+            tmp_file = self.cache_file + '.tmp'
+            try:
+                os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump({'version': FFPROBE_CACHE_VERSION, 'entries': entries}, f)
+                os.replace(tmp_file, self.cache_file)
+                self._entries = entries
+                self._dirty = False
+            except OSError as e:
+                print(f"警告: ffprobeキャッシュの保存に失敗しました: {e}")
 
 
 class ShortsValidator:
@@ -24,8 +193,29 @@ class ShortsValidator:
         'max_file_size': 128 * 1024 * 1024 * 1024  # 最大128GB（API経由）
     }
 
+    # ffprobeのパス（未検索はNone、見つからなかった場合はFalse）
+    _ffprobe_path_cache = None
+    _ffprobe_lock = threading.Lock()
+
+    # ffprobeの結果のキャッシュ
+    _probe_cache = _ProbeCache(FFPROBE_CACHE_FILE)
+
+    @classmethod
+    def find_ffprobe(cls):
+        """
+        ffprobeのパスを検索（結果はプロセス内でキャッシュする）
+
+        Returns:
+            str or None: ffprobeのパス、見つからない場合はNone
+        """
+        with cls._ffprobe_lock:
+            if cls._ffprobe_path_cache is None:
+                cls._ffprobe_path_cache = cls._search_ffprobe() or False
+
+        return cls._ffprobe_path_cache or None
+
     @staticmethod
-    def find_ffprobe():
+    def _search_ffprobe():
         """
         ffprobeのパスを検索
 
@@ -33,33 +223,27 @@ class ShortsValidator:
             str or None: ffprobeのパス、見つからない場合はNone
         """
         # 1. システムのPATHから検索
-        try:
-            subprocess.run(
-                ['ffprobe', '-version'],
-                capture_output=True,
-                check=True
-            )
-            return 'ffprobe'
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
-
         # 2. プロジェクト内のポータブル版を検索（Windows）
         portable_paths = [
             os.path.join('ffmpeg', 'bin', 'ffprobe.exe'),
             os.path.join('..', 'ffmpeg', 'bin', 'ffprobe.exe'),
         ]
-
-        for path in portable_paths:
-            if os.path.exists(path):
-                try:
-                    subprocess.run(
-                        [path, '-version'],
-                        capture_output=True,
-                        check=True
-                    )
-                    return path
-                except (subprocess.CalledProcessError, FileNotFoundError):
-                    pass
+        candidates = ['ffprobe'] + [path for path in portable_paths if os.path.exists(path)]
+
+        for path in candidates:
+            # 出力は使わないため捨て、成否は終了コードで判定する
+            try:
+                result = subprocess.run(
+                    [path, '-version'],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+            except OSError:
+                continue
+
+            if result.returncode == 0:
+                return path
 
         return None
 
@@ -84,10 +268,18 @@ class ShortsValidator:
         Returns:
             dict: 動画情報、取得に失敗した場合はNone
         """
-        if not os.path.exists(video_file):
+        try:
+            st = os.stat(video_file)
+        except OSError:
             print(f"エラー: ファイルが見つかりません: {video_file}")
             return None
 
+        # 前回から変更されていないファイルはffprobeを実行しない
+        cache_key = os.path.abspath(video_file)
+        video_info = ShortsValidator._probe_cache.get(cache_key, st)
+        if video_info is not None:
+            return video_info
+
         ffprobe_path = ShortsValidator.find_ffprobe()
         if not ffprobe_path:
             print("警告: ffprobeがインストールされていません")
@@ -101,24 +293,84 @@ class ShortsValidator:
             cmd = [
                 ffprobe_path,
                 '-v', 'error',
+                '-threads', '1',  # 並列化はファイル単位で行う
+                # 検証に使う項目だけを出力する（最初の映像ストリームのみ）
+                '-select_streams', 'v:0',
+                '-show_entries', FFPROBE_ENTRIES,
                 '-print_format', 'json',
-                '-show_streams',
-                '-show_format',
                 video_file
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            # 出力は文字列に変換せず、バイト列のままJSONとして解析する
+            # （-v error で抑えているため、stderrは受け取らない）
+            result = subprocess.run(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                check=True
+            )
             video_info = json.loads(result.stdout)
 
+            ShortsValidator._probe_cache.put(cache_key, st, video_info)
             return video_info
 
         except subprocess.CalledProcessError as e:
             print(f"エラー: ffprobeの実行に失敗しました: {e}")
             return None
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             print(f"エラー: ffprobeの出力を解析できませんでした: {e}")
             return None
 
+    @staticmethod
+    def _parse_rational(value):
+        """
+        ffprobeの分数表記（例: "30000/1001"）を数値に変換
+
+        Args:
+            value (str): 分数表記の文字列
+
+        Returns:
+            float: 変換した値（分母が0・形式が不正な場合は0.0）
+        """
+        num, _, den = str(value).partition('/')
+        try:
+            denominator = float(den or '1')
+            return float(num) / denominator if denominator else 0.0
+        except ValueError:
+            return 0.0
+
+    @staticmethod
+    def evaluate_specs(width, height, duration, file_size, is_vertical, is_square):
+        """
+        動画の基本情報がShorts要件を満たしているか判定（ffprobeは実行しない）
+
+        Args:
+            width (int): 幅
+            height (int): 高さ
+            duration (float): 動画の長さ（秒）
+            file_size (int): ファイルサイズ（バイト）
+            is_vertical (bool): 縦型か
+            is_square (bool): 正方形か
+
+        Returns:
+            tuple: (dict, bool) - (要件ごとの判定結果, 解像度が最小解像度以上か)
+        """
+        shorts_specs = ShortsValidator.SHORTS_SPECS
+
+        # 解像度は警告のみとし、エラーにしない
+        checks = {
+            'duration': duration <= shorts_specs['max_duration'],
+            'aspect_ratio': is_vertical or is_square,
+            'file_size': file_size <= shorts_specs['max_file_size']
+        }
+
+        # 解像度チェック（警告のみ、エラーにしない）
+        min_resolution = shorts_specs['min_resolution']
+        resolution_ok = height >= min_resolution or width >= min_resolution
+
+        return checks, resolution_ok
+
     @staticmethod
     def check_video_specs(video_file):
         """
@@ -135,11 +387,9 @@ class ShortsValidator:
         if not video_info:
             return False, "動画情報を取得できませんでした"
 
-        # ビデオストリームを取得
-        video_stream = next(
-            (s for s in video_info.get('streams', []) if s.get('codec_type') == 'video'),
-            None
-        )
+        # ビデオストリームを取得（ffprobeで最初の映像ストリームだけを選択している）
+        streams = video_info.get('streams')
+        video_stream = streams[0] if streams else None
 
         if not video_stream:
             return False, "ビデオストリームが見つかりません"
@@ -154,7 +404,10 @@ class ShortsValidator:
         if height == 0:
             return False, "動画の高さが0です"
 
-        aspect_ratio = width / height
+        aspect = _KNOWN_ASPECTS.get((width, height))
+        if aspect is None:
+            aspect = _classify_aspect(width, height)
+        aspect_ratio_decimal, is_vertical, is_square = aspect
 
         # 動画情報をまとめる
         specs = {
@@ -163,57 +416,75 @@ class ShortsValidator:
             'duration': duration,
             'file_size': file_size,
             'aspect_ratio': f"{width}:{height}",
-            'aspect_ratio_decimal': round(aspect_ratio, 3),
-            'is_vertical': aspect_ratio < 1,
-            'is_square': abs(aspect_ratio - 1.0) < 0.1,
+            'aspect_ratio_decimal': aspect_ratio_decimal,
+            'is_vertical': is_vertical,
+            'is_square': is_square,
             'codec': video_stream.get('codec_name', 'unknown'),
-            'fps': eval(video_stream.get('r_frame_rate', '0/1'))
+            'fps': ShortsValidator._parse_rational(video_stream.get('r_frame_rate', '0/1'))
         }
 
         # Shorts要件の検証
-        # 解像度は警告のみとし、エラーにしない
-        checks = {
-            'duration': duration <= ShortsValidator.SHORTS_SPECS['max_duration'],
-            'aspect_ratio': specs['is_vertical'] or specs['is_square'],
-            'file_size': file_size <= ShortsValidator.SHORTS_SPECS['max_file_size']
-        }
-
-        # 解像度チェック（警告のみ、エラーにしない）
-        resolution_ok = (height >= ShortsValidator.SHORTS_SPECS['min_resolution'] or
-                        width >= ShortsValidator.SHORTS_SPECS['min_resolution'])
+        checks, resolution_ok = ShortsValidator.evaluate_specs(
+            width, height, duration, file_size, is_vertical, is_square
+        )
 
         specs['checks'] = checks
         specs['resolution_ok'] = resolution_ok
         specs['is_valid'] = all(checks.values())
 
-        # 警告とエラーメッセージの生成
-        messages = []
+        # 警告・エラーの理由コード（表示用の文章は format_messages で必要な時に作る）
+        shorts_specs = ShortsValidator.SHORTS_SPECS
+        recommended_resolution = shorts_specs['recommended_resolution']
+        reasons = []
 
         if not checks['duration']:
-            messages.append(f"✗ 動画の長さが{ShortsValidator.SHORTS_SPECS['max_duration']}秒を超えています（{duration:.1f}秒）")
-        elif duration > ShortsValidator.SHORTS_SPECS['recommended_duration']:
-            messages.append(f"⚠ 動画の長さが推奨される{ShortsValidator.SHORTS_SPECS['recommended_duration']}秒を超えています（{duration:.1f}秒）")
+            reasons.append('duration_exceeded')
+        elif duration > shorts_specs['recommended_duration']:
+            reasons.append('duration_long')
 
         # 解像度は警告のみ（エラーにしない）
         if not resolution_ok:
-            messages.append(f"⚠ 解像度が低いです（{width}x{height}）")
-            messages.append(f"  推奨: {ShortsValidator.SHORTS_SPECS['min_resolution']}p以上")
-        elif (height < ShortsValidator.SHORTS_SPECS['recommended_resolution'] and
-              width < ShortsValidator.SHORTS_SPECS['recommended_resolution']):
-            messages.append(f"⚠ 解像度が推奨値より低いです（{width}x{height}）")
-            messages.append(f"  推奨: {ShortsValidator.SHORTS_SPECS['recommended_resolution']}p以上")
+            reasons.append('resolution_low')
+        elif height < recommended_resolution and width < recommended_resolution:
+            reasons.append('resolution_below_recommended')
 
         if not checks['aspect_ratio']:
-            messages.append(f"✗ アスペクト比が要件を満たしていません（{specs['aspect_ratio_decimal']}）")
-            messages.append("  推奨: 9:16（縦型）または 1:1（正方形）")
+            reasons.append('aspect_ratio')
 
         if not checks['file_size']:
-            messages.append(f"✗ ファイルサイズが大きすぎます（{file_size / (1024**3):.2f} GB）")
+            reasons.append('file_size')
 
-        specs['messages'] = messages
+        specs['reasons'] = reasons
 
         return specs['is_valid'], specs
 
+    @staticmethod
+    def format_messages(specs):
+        """
+        検証結果の理由コードを表示用のメッセージに変換
+
+        Args:
+            specs (dict): check_video_specs が返す動画情報
+
+        Returns:
+            list: メッセージのリスト
+        """
+        shorts_specs = ShortsValidator.SHORTS_SPECS
+        values = dict(
+            specs,
+            file_size_gb=specs['file_size'] / (1024**3),
+            max_duration=shorts_specs['max_duration'],
+            recommended_duration=shorts_specs['recommended_duration'],
+            min_resolution=shorts_specs['min_resolution'],
+            recommended_resolution=shorts_specs['recommended_resolution']
+        )
+
+        return [
+            template.format(**values)
+            for reason in specs.get('reasons', [])
+            for template in _REASON_MESSAGES[reason]
+        ]
+
     @staticmethod
     def print_validation_result(video_file, result, specs):
         """
@@ -224,51 +495,146 @@ class ShortsValidator:
             result (bool): 検証結果
             specs (dict or str): 動画情報またはエラーメッセージ
         """
-        print(f"\n=== 動画検証結果: {os.path.basename(video_file)} ===")
+        # 1ファイル分の表示をまとめて1回で出力する
+        lines = [f"\n=== 動画検証結果: {os.path.basename(video_file)} ==="]
 
         if isinstance(specs, str):
             # エラーメッセージの場合
-            print(f"エラー: {specs}")
+            lines.append(f"エラー: {specs}")
+            print('\n'.join(lines))
             return
 
         # 基本情報
-        print(f"\n【基本情報】")
-        print(f"  解像度: {specs['width']}x{specs['height']}")
-        print(f"  アスペクト比: {specs['aspect_ratio']} ({specs['aspect_ratio_decimal']})")
-        print(f"  動画の長さ: {specs['duration']:.1f}秒")
-        print(f"  ファイルサイズ: {specs['file_size'] / (1024**2):.2f} MB")
-        print(f"  コーデック: {specs['codec']}")
-        print(f"  フレームレート: {specs['fps']:.2f} fps")
+        lines += [
+            "\n【基本情報】",
+            f"  解像度: {specs['width']}x{specs['height']}",
+            f"  アスペクト比: {specs['aspect_ratio']} ({specs['aspect_ratio_decimal']})",
+            f"  動画の長さ: {specs['duration']:.1f}秒",
+            f"  ファイルサイズ: {specs['file_size'] / (1024**2):.2f} MB",
+            f"  コーデック: {specs['codec']}",
+            f"  フレームレート: {specs['fps']:.2f} fps",
+        ]
 
         # 検証結果
-        print(f"\n【検証結果】")
+        lines.append("\n【検証結果】")
         if result:
-            print("✓ この動画はYouTube Shortsの要件を満たしています")
+            lines.append("✓ この動画はYouTube Shortsの要件を満たしています")
         else:
-            print("✗ この動画はYouTube Shortsの要件を満たしていません")
+            lines.append("✗ この動画はYouTube Shortsの要件を満たしていません")
 
         # 詳細メッセージ
-        if specs.get('messages'):
-            print(f"\n【詳細】")
-            for message in specs['messages']:
-                print(f"  {message}")
+        messages = ShortsValidator.format_messages(specs)
+        if messages:
+            lines.append("\n【詳細】")
+            lines += [f"  {message}" for message in messages]
+
+        print('\n'.join(lines))
 
     @staticmethod
-    def validate_directory(directory, pattern='*.mp4'):
+    def find_video_files(directory, pattern='*.mp4'):
+        """
+        ディレクトリ内でパターンに一致する動画ファイルを名前順に取得
+
+        Args:
+            directory (str): ディレクトリのパス
+            pattern (str): ファイルパターン（'sub/*.mp4' のようにサブディレクトリも指定できる）
+
+        Returns:
+            list: 動画ファイルのパスのリスト（ディレクトリが無い場合は空）
+        """
+        # サブディレクトリを含むパターンは glob に任せる
+        if '/' in pattern or os.sep in pattern:
+            return sorted(
+                path for path in glob.glob(os.path.join(directory, pattern))
+                if os.path.isfile(path)
+            )
+
+        # scandirはエントリの種別を返すため、ファイルごとのstatが不要
+        # glob と同様に、パターンが '.' で始まらない限り隠しファイルは対象外
+        try:
+            with os.scandir(directory) as entries:
+                return sorted(
+                    entry.path for entry in entries
+                    if (pattern.startswith('.') or not entry.name.startswith('.'))
+                    and fnmatch.fnmatch(entry.name, pattern)
+                    and entry.is_file()
+                )
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
+    @staticmethod
+    def _iter_check_video_specs(video_files):
+        """
+        動画ファイルを並行して検証し、渡された順に結果を返す
+
+        Args:
+            video_files (list): 動画ファイルのパスのリスト
+
+        Yields:
+            tuple: (動画ファイル, 検証結果, 動画情報またはエラーメッセージ)
+        """
+        if not video_files:
+            return
+
+        # ffprobeの実行はファイルごとに独立しているため並行して行う
+        # 一度に投入するのは workers 件まで（途中で止めた場合に残りのffprobeを待たない）
+        workers = min(VALIDATE_WORKERS, (os.cpu_count() or 1) * 4, len(video_files))
+        executor = ThreadPoolExecutor(max_workers=workers)
+        pending = deque()  # 投入済みで結果をまだ返していない (動画ファイル, Future)
+        next_files = iter(video_files)
+
+        def submit_next():
+            for video_file in itertools.islice(next_files, 1):
+                pending.append((video_file, executor.submit(ShortsValidator.check_video_specs, video_file)))
+
+        try:
+            for _ in range(workers):
+                submit_next()
+
+            while pending:
+                video_file, future = pending.popleft()
+                result, specs = future.result()
+                submit_next()
+                yield video_file, result, specs
+        finally:
+            # 開始前の検証は取り消し、実行中のものだけ完了を待つ
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+            ShortsValidator._probe_cache.save()
+
+    @staticmethod
+    def iter_validate_directory(directory, pattern='*.mp4'):
+        """
+        ディレクトリ内の全動画ファイルを検証し、1ファイルずつ結果を返す
+
+        結果を保持しないため、大量のファイルを検証する場合に使う
+
+        Args:
+            directory (str): ディレクトリのパス
+            pattern (str): ファイルパターン
+
+        Yields:
+            tuple: (動画ファイル, 検証結果, 動画情報またはエラーメッセージ)
+        """
+        video_files = ShortsValidator.find_video_files(directory, pattern)
+        yield from ShortsValidator._iter_check_video_specs(video_files)
+
+    @staticmethod
+    def validate_directory(directory, pattern='*.mp4', collect_results=False):
         """
         ディレクトリ内の全動画ファイルを検証
 
         Args:
             directory (str): ディレクトリのパス
             pattern (str): ファイルパターン
+            collect_results (bool): ファイルごとの結果をサマリーに含めるか
 
         Returns:
-            dict: 検証結果のサマリー
+            dict: 検証結果のサマリー（collect_results=Trueの場合は 'results' を含む）
         """
-        import glob
-
         search_pattern = os.path.join(directory, pattern)
-        video_files = sorted(glob.glob(search_pattern))
+        video_files = ShortsValidator.find_video_files(directory, pattern)
 
         if not video_files:
             print(f"警告: {search_pattern} に一致するファイルが見つかりませんでした")
@@ -281,9 +647,8 @@ class ShortsValidator:
         invalid_count = 0
         results = []
 
-        for video_file in video_files:
-            result, specs = ShortsValidator.check_video_specs(video_file)
-
+        # 表示はファイル名順
+        for video_file, result, specs in ShortsValidator._iter_check_video_specs(video_files):
             if result:
                 valid_count += 1
                 status = "✓"
@@ -293,23 +658,27 @@ class ShortsValidator:
 
             print(f"{status} {os.path.basename(video_file)}")
 
-            results.append({
-                'file': video_file,
-                'valid': result,
-                'specs': specs
-            })
+            if collect_results:
+                results.append({
+                    'file': video_file,
+                    'valid': result,
+                    'specs': specs
+                })
 
         print(f"\n=== 検証サマリー ===")
         print(f"合計: {len(video_files)}")
         print(f"有効: {valid_count}")
         print(f"無効: {invalid_count}")
 
-        return {
+        summary = {
             'total': len(video_files),
             'valid': valid_count,
-            'invalid': invalid_count,
-            'results': results
+            'invalid': invalid_count
         }
+        if collect_results:
+            summary['results'] = results
+
+        return summary
 
 
 if __name__ == '__main__':
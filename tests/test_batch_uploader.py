@@ -0,0 +1,37 @@
+"""
+batch_uploader のテスト
+"""
+
+import csv
+import io
+import unittest
+
+from src.batch_uploader import _split_tags, ShortsBatchUploader
+
+
+class TestSplitTags(unittest.TestCase):
+    """tags列の解析"""
+
+    def test_comma_separated(self):
+        self.assertEqual(_split_tags('a, b,,c'), ['a', 'b', 'c'])
+
+    def test_quoted_tag_with_comma(self):
+        self.assertEqual(_split_tags('a,"b,c"'), ['a', 'b,c'])
+
+    def test_empty(self):
+        self.assertEqual(_split_tags(''), [])
+        self.assertEqual(_split_tags(None), [])
+
+    def test_newline_in_cell(self):
+        # 引用符で囲んだCSVセルには改行を含められる
+        self.assertEqual(_split_tags('a,\nb\r\nc'), ['a', 'b', 'c'])
+
+    def test_newline_in_csv_row(self):
+        data = 'file,title,tags\nv.mp4,t,"Shorts,\n自動投稿"\n'
+        row = next(csv.DictReader(io.StringIO(data)))
+        metadata = ShortsBatchUploader.row_to_metadata(row)
+        self.assertEqual(metadata['tags'], ['Shorts', '自動投稿'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,23 @@
+"""
+src パッケージのテスト
+"""
+
+import unittest
+
+import src
+
+
+class TestLazyImports(unittest.TestCase):
+    """公開名の遅延インポート"""
+
+    def test_dir_has_no_duplicates(self):
+        # 読み込み済みの名前は globals() にも入るため、重複しないこと
+        src.QuotaManager
+        names = dir(src)
+        self.assertEqual(len(names), len(set(names)))
+        self.assertIn('QuotaManager', names)
+        self.assertIn('ShortsValidator', names)
+
+
+if __name__ == '__main__':
+    unittest.main()
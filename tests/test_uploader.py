@@ -0,0 +1,45 @@
+"""
+uploader のテスト
+"""
+
+import unittest
+
+from src.uploader import _SHORTS_RE, _backoff, MAX_RETRY_WAIT
+
+
+class TestShortsHashtag(unittest.TestCase):
+    """#Shorts ハッシュタグの判定"""
+
+    def test_japanese_suffix(self):
+        self.assertTrue(_SHORTS_RE.search('今日の料理 #Shortsです'))
+        self.assertTrue(_SHORTS_RE.search('#Shorts動画'))
+
+    def test_case_insensitive(self):
+        self.assertTrue(_SHORTS_RE.search('猫 #SHORTS'))
+        self.assertTrue(_SHORTS_RE.search('猫 #shorts, #cat'))
+
+    def test_longer_tag(self):
+        self.assertFalse(_SHORTS_RE.search('#shortsfilm'))
+        self.assertFalse(_SHORTS_RE.search('#Shorts_2025'))
+        self.assertFalse(_SHORTS_RE.search('Shorts'))
+
+
+class TestBackoff(unittest.TestCase):
+    """再試行までの待機時間"""
+
+    def test_retry_after(self):
+        self.assertEqual(_backoff(0, {'retry-after': '30'}), 30.0)
+
+    def test_retry_after_over_limit(self):
+        # 上限を超える指定は短縮せず、再試行しない
+        self.assertIsNone(_backoff(0, {'retry-after': '3600'}))
+
+    def test_without_retry_after(self):
+        for attempt in range(10):
+            wait_time = _backoff(attempt, {})
+            self.assertTrue(0 <= wait_time <= MAX_RETRY_WAIT)
+        self.assertIsNotNone(_backoff(0, {'retry-after': 'Wed, 21 Oct 2026 07:28:00 GMT'}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+validator のテスト
+"""
+
+import os
+import time
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from src.validator import ShortsValidator
+
+
+class TestFindVideoFiles(unittest.TestCase):
+    """ディレクトリ内の動画ファイルの検索"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = self._tmp.name
+        os.mkdir(os.path.join(self.directory, 'sub'))
+        for name in ('b.mp4', 'a.mp4', '.hidden.mp4', 'c.mov', os.path.join('sub', 'd.mp4')):
+            open(os.path.join(self.directory, name), 'w').close()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def names(self, pattern):
+        return [
+            os.path.relpath(path, self.directory)
+            for path in ShortsValidator.find_video_files(self.directory, pattern)
+        ]
+
+    def test_pattern(self):
+        self.assertEqual(self.names('*.mp4'), ['a.mp4', 'b.mp4'])
+
+    def test_hidden_pattern(self):
+        self.assertEqual(self.names('.*.mp4'), ['.hidden.mp4'])
+
+    def test_subdirectory_pattern(self):
+        self.assertEqual(self.names('sub/*.mp4'), [os.path.join('sub', 'd.mp4')])
+
+    def test_missing_directory(self):
+        self.assertEqual(ShortsValidator.find_video_files(os.path.join(self.directory, 'none')), [])
+        self.assertEqual(ShortsValidator.find_video_files(os.path.join(self.directory, 'a.mp4')), [])
+
+
+class TestIterCheckVideoSpecs(unittest.TestCase):
+    """動画ファイルの並行検証"""
+
+    def test_close_stops_remaining_probes(self):
+        calls = []
+        lock = threading.Lock()
+
+        def check_video_specs(video_file):
+            with lock:
+                calls.append(video_file)
+            time.sleep(0.05)
+            return True, {}
+
+        video_files = [f'{i}.mp4' for i in range(200)]
+        with mock.patch.object(ShortsValidator, 'check_video_specs', side_effect=check_video_specs):
+            results = ShortsValidator._iter_check_video_specs(video_files)
+            self.assertEqual(next(results)[0], '0.mp4')
+
+            started = time.monotonic()
+            results.close()
+            elapsed = time.monotonic() - started
+
+        # 実行中だった分だけ待ち、残りのファイルは検証しない
+        self.assertLess(len(calls), 40)
+        self.assertLess(elapsed, 1.0)
+
+    def test_results_in_order(self):
+        with mock.patch.object(ShortsValidator, 'check_video_specs', side_effect=lambda path: (True, path)):
+            results = list(ShortsValidator._iter_check_video_specs([f'{i}.mp4' for i in range(50)]))
+
+        self.assertEqual([specs for _, _, specs in results], [f'{i}.mp4' for i in range(50)])
+
+
+if __name__ == '__main__':
+    unittest.main()